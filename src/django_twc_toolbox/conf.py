@@ -11,6 +11,8 @@ DJANGO_TWC_TOOLBOX_SETTINGS_NAME = "DJANGO_TWC_TOOLBOX"
 
 @dataclass(frozen=True)
 class AppSettings:
+    CACHE_TIME_DATE_PAGINATOR = 60 * 5  # five minutes
+    CACHE_TIME_PAGINATOR_COUNT = 60 * 5  # five minutes
     CACHE_TIME_ROBOTS_TXT = 60 * 60 * 24  # one day
     CACHE_TIME_SECURITY_TXT = 60 * 60 * 24  # one day
     TEMPLATE_404 = "404.html"
@@ -2,22 +2,42 @@
 from __future__ import annotations
 
 import sys
+import weakref
 from collections.abc import Callable
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import ClassVar
 from typing import Literal
+from typing import cast
 
+from django.core.exceptions import FieldDoesNotExist
 from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import InvalidPage
+from django.core.paginator import Page
+from django.core.paginator import Paginator
 from django.db import models
 from django.http import Http404
 from django.http import HttpRequest
 from django.http import HttpResponse
 from django.template.response import TemplateResponse
+from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
+from django_filters.filterset import filterset_factory
 from django_htmx.middleware import HtmxDetails
 from django_tables2 import tables
 from django_tables2.views import SingleTableMixin
 from neapolitan.views import CRUDView as NeapolitanCRUDView
 from neapolitan.views import Role
 
+from django_twc_toolbox.paginator import CountlessPaginator
+from django_twc_toolbox.paginator import CountStrategy
+from django_twc_toolbox.paginator import CountStrategyPaginator
+from django_twc_toolbox.paginator import KeysetPage
+from django_twc_toolbox.paginator import KeysetPaginator
+
+if TYPE_CHECKING:
+    from django.core.paginator import _SupportsPagination
+
 if sys.version_info >= (3, 12):
     from typing import override
 else:  # pragma: no cover
@@ -28,12 +48,152 @@ class HtmxHttpRequest(HttpRequest):
     htmx: HtmxDetails | None
 
 
+class _FilterSetMixin:
+    """Helpers added to the FilterSet class of a `CRUDView` list view.
+
+    The view generates a subclass of its FilterSet class with this mixin once,
+    see `CRUDView.get_filterset_class`, instead of changing the class itself.
+    """
+
+    def is_active(self) -> bool:
+        return bool(self.active_filters)
+
+    @cached_property
+    def active_filters(self) -> dict[str, object]:
+        return {
+            key: value
+            for key, value in self.form.cleaned_data.items()  # type: ignore[attr-defined]
+            if value not in (None, "", [], {})
+        }
+
+
+def _get_secondary_fields(filterset: Any) -> list[str]:
+    """Return the filters of `filterset` that are not primary, in form order.
+
+    This reads the form of the instance rather than `base_filters`, so filters
+    added in the FilterSet's `__init__` are included.
+    """
+    return [
+        name for name in filterset.form.fields if name not in filterset.primary_fields
+    ]
+
+
+# the generated FilterSet classes of each view class, keyed by the options they
+# were generated from, which may also be passed to `as_view`
+_filterset_classes: weakref.WeakKeyDictionary[
+    type[CRUDView], dict[tuple[object, ...], type]
+] = weakref.WeakKeyDictionary()
+
+
+def _is_empty_page(page: Page[models.Model] | KeysetPage[models.Model]) -> bool:
+    """Return whether `page` shows that the paginated list is empty.
+
+    An exact count has already been run to validate the page number, so it is
+    reused, otherwise only an empty first page means the list is empty. Either way
+    this costs no query beyond the page's own.
+    """
+    paginator = page.paginator
+    if isinstance(paginator, CountlessPaginator | KeysetPaginator) or (
+        isinstance(paginator, CountStrategyPaginator)
+        and paginator.count_strategy.approximate
+    ):
+        return not page.has_previous() and len(page.object_list) == 0
+    return paginator.count == 0
+
+
+# the generated list view classes, keyed by view class and table class. this is a
+# permanent cache, each generated class subclasses its view class and keeps it
+# alive anyway, just like the URL patterns that usually hold on to both
+_list_view_with_table_classes: dict[
+    tuple[type[CRUDView], type[tables.Table]], type[CRUDView]
+] = {}
+
+
+class _TableCountStrategy(CountStrategy):
+    """Count a table's rows with the view's `count_strategy`, through their QuerySet.
+
+    The table's paginator is given the table's `BoundRows`, which a strategy like
+    `CachedCount` or `EstimatedCount` would only count exactly with `len()`, so
+    the QuerySet behind the rows is counted instead.
+    """
+
+    def __init__(self, count_strategy: CountStrategy) -> None:
+        self.count_strategy = count_strategy
+        self.approximate = count_strategy.approximate  # type: ignore[misc]
+
+    @override
+    def count(self, object_list: _SupportsPagination[Any]) -> int:
+        queryset = getattr(getattr(object_list, "data", None), "data", None)
+        if isinstance(queryset, models.QuerySet):
+            return self.count_strategy.count(queryset)
+        return self.count_strategy.count(object_list)
+
+
+class _SingleTableMixin(SingleTableMixin):
+    """`SingleTableMixin` that paginates the list view through its table.
+
+    The table is built once per request, and its page is the list view's page,
+    so a list request with a table counts and fetches its rows only once.
+    """
+
+    def get_table(self, **kwargs: object) -> tables.Table:
+        if "_table" not in self.__dict__:
+            self.__dict__["_table"] = super().get_table(**kwargs)  # type: ignore[misc]
+        return self.__dict__["_table"]
+
+    def get_table_pagination(self, table: tables.Table) -> dict[str, object] | bool:
+        paginate = super().get_table_pagination(table)  # type: ignore[misc]
+        if paginate is False:
+            return False
+        paginate = {} if paginate is True else dict(paginate)
+        # raise for out of range pages, like the list view does without a table
+        paginate.setdefault("silent", False)
+        count_strategy = getattr(self, "count_strategy", None)
+        if count_strategy is not None:
+            paginate.setdefault("count_strategy", _TableCountStrategy(count_strategy))
+        return paginate
+
+    def paginate_queryset(
+        self, queryset: models.QuerySet[models.Model], page_size: int
+    ) -> Page[models.Model]:
+        try:
+            table = self.get_table(**self.get_table_kwargs())  # type: ignore[attr-defined]
+        except InvalidPage as exc:
+            msg = "Invalid page: %s"
+            raise Http404(_(msg) % str(exc)) from exc
+        page = getattr(table, "page", None)
+        if page is None:
+            # the table is not paginated, so paginate the list view as usual
+            return super().paginate_queryset(queryset, page_size)  # type: ignore[misc]
+        return page
+
+
 class CRUDView(NeapolitanCRUDView):
     paginate_by = 100
+    # the paginator used by the list view, set to `KeysetPaginator` to page deep
+    # lists by cursor instead of by page number
+    paginator_class: ClassVar[type[Paginator] | type[KeysetPaginator]] = (
+        CountStrategyPaginator
+    )
+    # how the list view's paginator counts the queryset, e.g. `CachedCount()` or
+    # `EstimatedCount()` for very large tables, defaults to an exact count
+    count_strategy: ClassVar[CountStrategy | None] = None
 
     detail_fields: ClassVar[list[str] | None] = None
     list_fields: ClassVar[list[str] | None] = None
 
+    # the list and detail views follow the relations in their fields with
+    # `select_related`/`prefetch_related`, so that rendering a related object doesn't
+    # run a query per row. set to `False` to opt out, and use `select_related` and
+    # `prefetch_related` to add paths the fields don't cover, e.g. "folder__owner"
+    auto_related: ClassVar[bool] = True
+    select_related: ClassVar[list[str] | None] = None
+    prefetch_related: ClassVar[list[str] | None] = None
+
+    # the list view only loads the columns it shows, set to `False` to load every
+    # column, e.g. when a custom list template reads fields the view doesn't list
+    list_only: ClassVar[bool] = True
+
     table_class: ClassVar[type[tables.Table] | None] = None
     table_data: ClassVar[dict[str, object] | None] = None
 
@@ -89,6 +249,133 @@ class CRUDView(NeapolitanCRUDView):
     def get_list_fields(self):
         return self.list_fields
 
+    def get_related_lookups(self) -> tuple[list[str], list[str]]:
+        """Return the `select_related` and `prefetch_related` paths of the role.
+
+        Single-valued relations among the list or detail fields (forward foreign
+        keys and one-to-ones both ways) are joined, and multi-valued ones are
+        prefetched, followed by the view's own `select_related` and
+        `prefetch_related` paths. Only the list and detail views follow relations.
+        """
+        if getattr(self, "role", None) not in (Role.LIST, Role.DETAIL):
+            return [], []
+
+        select_related: list[str] = []
+        prefetch_related: list[str] = []
+
+        if self.auto_related and self.model is not None:
+            try:
+                fields = self.get_fields()
+            except ImproperlyConfigured:
+                fields = []
+            for name in fields:
+                try:
+                    field = self.model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    # a property or method, there's nothing to follow
+                    continue
+                if not field.is_relation:
+                    continue
+                if (field.many_to_one or field.one_to_one) and (
+                    field.concrete or field.auto_created
+                ):
+                    select_related.append(name)
+                else:
+                    prefetch_related.append(name)
+
+        select_related.extend(
+            path for path in self.select_related or [] if path not in select_related
+        )
+        prefetch_related.extend(
+            path for path in self.prefetch_related or [] if path not in prefetch_related
+        )
+
+        return select_related, prefetch_related
+
+    def get_list_only_fields(self) -> list[str] | None:
+        """Return the fields the list view loads with `only()`, or `None` for all.
+
+        These are the primary key, the `lookup_field` and the concrete columns
+        of the list fields, or of the `table_class` columns, along with the
+        relations joined by `select_related`. If any of those names isn't a model
+        field, such as a property or a template column, there's no telling which
+        columns it reads, so every column is loaded.
+        """
+        if (
+            getattr(self, "role", None) != Role.LIST
+            or not self.list_only
+            or self.model is None
+        ):
+            return None
+
+        # a list view with a table has `SingleTableMixin.get_table_class`, which
+        # may build the table from the model when the view has no `table_class`
+        get_table_class = getattr(self, "get_table_class", None)
+        table_class = (
+            get_table_class() if get_table_class is not None else self.table_class
+        )
+
+        if table_class is not None:
+            names = [
+                str(column.accessor or name).replace(".", "__").split("__")[0]
+                for name, column in table_class.base_columns.items()  # type: ignore[union-attr]
+            ]
+        else:
+            try:
+                names = list(self.get_fields())
+            except ImproperlyConfigured:
+                return None
+
+        opts = self.model._meta
+        only_fields = [opts.pk.name]
+        if self.lookup_field != "pk":
+            only_fields.append(self.lookup_field)
+
+        select_related, _ = self.get_related_lookups()
+        names.extend(path.split("__")[0] for path in select_related)
+
+        for name in names:
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if field.concrete and not field.many_to_many:
+                column_names = [field.name]
+            elif field.is_relation and not field.auto_created and field.many_to_one:
+                # a generic foreign key, which reads its content type and object id
+                column_names = [field.ct_field, field.fk_field]  # type: ignore[union-attr]
+            else:
+                # a many-to-many or reverse relation, which are fetched separately
+                continue
+            only_fields.extend(
+                column_name
+                for column_name in column_names
+                if column_name not in only_fields
+            )
+
+        return only_fields
+
+    @override
+    def get_queryset(self) -> models.QuerySet[models.Model]:
+        queryset = super().get_queryset()
+
+        select_related, prefetch_related = self.get_related_lookups()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        only_fields = self.get_list_only_fields()
+        # leave a queryset that already picks its own columns as it is
+        if (
+            only_fields is not None
+            and queryset._fields is None  # type: ignore[attr-defined]  # pyright: ignore[reportPrivateUsage]
+            and queryset.query.deferred_loading == (frozenset(), True)
+        ):
+            queryset = queryset.only(*only_fields)
+
+        return queryset
+
     @override
     def list(
         self, request: HttpRequest, *args: object, **kwargs: object
@@ -101,14 +388,14 @@ class CRUDView(NeapolitanCRUDView):
         if filterset is not None:
             queryset = filterset.qs  # type:ignore[attr-defined]
 
-        if not self.allow_empty and not queryset.exists():
-            raise Http404
-
         self.object_list = queryset
 
         paginate_by = self.get_paginate_by(self.object_list)
 
         if paginate_by is None:
+            # evaluating the queryset caches its rows for the template
+            if not self.allow_empty and not self.object_list:
+                raise Http404
             context = self.get_context_data(
                 page_obj=None,
                 is_paginated=False,
@@ -117,11 +404,13 @@ class CRUDView(NeapolitanCRUDView):
             )
         else:
             page = self.paginate_queryset(self.object_list, paginate_by)
-            # if we are not using django-tables2, make sure to set the `object_list` to
-            # the paginated list. this is how neapolitan expects pagination to work.
-            # if using django-tables2, we just let that library handle pagination.
-            if self.table_class is None:
-                self.object_list = page.object_list
+            if not self.allow_empty and _is_empty_page(page):
+                raise Http404
+            # make sure to set the `object_list` to the paginated list. this is how
+            # neapolitan expects pagination to work. if using django-tables2, the page
+            # is the table's own page, so this is the rows the table renders, and
+            # the template checking `object_list` doesn't fetch the whole list.
+            self.object_list = page.object_list
             context = self.get_context_data(
                 page_obj=page,
                 is_paginated=page.has_other_pages(),
@@ -136,37 +425,87 @@ class CRUDView(NeapolitanCRUDView):
         return super().get_paginate_by()
 
     @override
-    def get_filterset(
-        self, queryset: models.QuerySet[models.Model] | None = None
-    ) -> object | None:
-        filterset = super().get_filterset(queryset)
+    def get_paginator(  # type: ignore[override]
+        self, queryset: models.QuerySet[models.Model], page_size: int
+    ) -> Paginator[models.Model] | KeysetPaginator[models.Model]:
+        if self.count_strategy is not None:
+            if not issubclass(self.paginator_class, CountStrategyPaginator):
+                msg = "'%s' sets a 'count_strategy' but its 'paginator_class' is not a CountStrategyPaginator"
+                raise ImproperlyConfigured(msg % self.__class__.__name__)
+            return self.paginator_class(
+                queryset, page_size, count_strategy=self.count_strategy
+            )
+        return self.paginator_class(queryset, page_size)
 
-        if filterset is None:
+    @override
+    def paginate_queryset(  # type: ignore[override]
+        self, queryset: models.QuerySet[models.Model], page_size: int
+    ) -> Page[models.Model] | KeysetPage[models.Model]:
+        if not issubclass(self.paginator_class, KeysetPaginator):
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = cast(
+            KeysetPaginator[models.Model], self.get_paginator(queryset, page_size)
+        )
+        cursor = self.request.GET.get("cursor")
+        try:
+            return paginator.page(cursor)
+        except InvalidPage as exc:
+            msg = "Invalid page (%s): %s"
+            raise Http404(_(msg) % (cursor, str(exc))) from exc
+
+    def get_filterset_class(self) -> type | None:
+        """Return the FilterSet class of the list view, or `None` to not filter.
+
+        This is a subclass of `filterset_class`, or of a class built from
+        `filterset_fields`, with `is_active()` and `active_filters`. When
+        `filterset_primary_fields` is set, `primary_fields` and `secondary_fields`
+        split the filters, otherwise any the FilterSet class declares are kept. It
+        is generated once for each view class and reused by every request.
+        """
+        filterset_class = getattr(self, "filterset_class", None)
+        filterset_fields = getattr(self, "filterset_fields", None)
+
+        if filterset_class is None and not filterset_fields:
             return None
 
-        if self.filterset_primary_fields is not None:
-            filterset.primary_fields = self.filterset_primary_fields  # type: ignore[attr-defined]
-            filterset.secondary_fields = list(  # type: ignore[attr-defined]
-                set(filterset.form.fields.keys()) - set(filterset.primary_fields)  # type:ignore[attr-defined]
-            )
+        primary_fields = self.filterset_primary_fields
+        key = (
+            filterset_class,
+            tuple(filterset_fields or ()),
+            None if primary_fields is None else tuple(primary_fields),
+        )
+        classes = _filterset_classes.setdefault(type(self), {})
+        if key in classes:
+            return classes[key]
 
-        def is_active(filterset: object) -> bool:
-            return any(
-                value not in (None, "", [], {})
-                for value in filterset.form.cleaned_data.values()  # type: ignore[attr-defined]
-            )
+        if filterset_class is None:
+            filterset_class = filterset_factory(self.model, fields=filterset_fields)
+
+        attrs: dict[str, object] = {"__module__": filterset_class.__module__}
+        if primary_fields is not None:
+            attrs["primary_fields"] = list(primary_fields)
+            attrs["secondary_fields"] = cached_property(_get_secondary_fields)
 
-        def get_active_filters(filterset: object):
-            return {
-                key: value
-                for key, value in filterset.form.cleaned_data.items()  # type:ignore[attr-defined]
-                if value not in (None, "", [], {})
-            }
+        return classes.setdefault(
+            key,
+            type(filterset_class.__name__, (_FilterSetMixin, filterset_class), attrs),
+        )
+
+    @override
+    def get_filterset(
+        self, queryset: models.QuerySet[models.Model] | None = None
+    ) -> object | None:
+        filterset_class = self.get_filterset_class()
 
-        filterset.__class__.is_active = is_active  # type:ignore[attr-defined]
-        filterset.__class__.active_filters = property(get_active_filters)  # type:ignore[attr-defined]
+        if filterset_class is None:
+            return None
 
-        return filterset
+        return filterset_class(
+            self.request.GET,
+            queryset=queryset,
+            request=self.request,
+        )
 
     @override
     def get_context_data(self, **kwargs: object) -> dict[str, object]:
@@ -261,6 +600,10 @@ class CRUDView(NeapolitanCRUDView):
         if role != Role.LIST or cls.table_class is None:
             return super().as_view(role=role, **initkwargs)
 
+        if issubclass(cls.paginator_class, KeysetPaginator):
+            msg = "'%s' cannot use a KeysetPaginator with a 'table_class', django-tables2 paginates by page number"
+            raise ImproperlyConfigured(msg % cls.__name__)
+
         # View is a list view and has the `table_class` attribute set, so we need to override the class
         # returned by adding `django_tables2.views.SingleTableMixin` so that the table can be rendered.
         # I would normally just add this to the base CRUDView up top, but since this class is used for
@@ -268,16 +611,36 @@ class CRUDView(NeapolitanCRUDView):
         # be a bit clearer if it was just set above in the class declaration instead of doing this dance?
         # Unsure. Open to changing this later on in case this is too complicated.
         #
-        # We don't need to change anything else about the class (there's already some small logic around
-        # dealing with pagination in the `list` method above), so we can get away with just adding the mixin,
+        # We don't need to change anything else about the class (the mixin paginates the list view through
+        # the table, so the queryset is only paginated once), so we can get away with just adding the mixin,
         # inheriting from `cls` a.k.a. `django_twc_toolbox.crud.views.CRUDView`, and leaving the body of the
         # new view        # class empty (`...`).
         #
         # Also need to pass in the class variable `table_class` to the `as_view` class method so it's available
         # on the instance.
+        #
+        # The new view class is generated once for each view class and table class and then reused, see
+        # `get_list_view_with_table` below, so calling `as_view` (e.g. through `get_urls`) again is cheap.
 
-        class ListViewWithTable(SingleTableMixin, cls): ...  # type: ignore[misc,valid-type]
-
-        return ListViewWithTable.as_view(
+        return cls.get_list_view_with_table().as_view(
             role=role, table_class=cls.table_class, **initkwargs
         )
+
+    @classmethod
+    def get_list_view_with_table(cls) -> type[CRUDView]:
+        """Return the list view class of a view with a `table_class`.
+
+        The class is generated once for each view class and table class, and
+        reused by every later call of `as_view`.
+        """
+        if cls.table_class is None:
+            msg = "'%s' must define 'table_class' to have a list view with a table"
+            raise ImproperlyConfigured(msg % cls.__name__)
+
+        key = (cls, cls.table_class)
+        if key in _list_view_with_table_classes:
+            return _list_view_with_table_classes[key]
+
+        class ListViewWithTable(_SingleTableMixin, cls): ...  # type: ignore[misc,valid-type]
+
+        return _list_view_with_table_classes.setdefault(key, ListViewWithTable)
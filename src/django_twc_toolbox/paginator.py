@@ -1,39 +1,459 @@
 # pyright: reportAny=false,reportPrivateUsage=false
 from __future__ import annotations
 
+import base64
+import bisect
 import datetime
+import hashlib
+import inspect
+import itertools
+import json
+import operator
 import warnings
+from array import array
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from decimal import Decimal
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 from typing import Generic
+from typing import Literal
+from typing import NamedTuple
+from typing import TypeAlias
 from typing import TypeVar
 from typing import cast
+from typing import get_args
+from typing import overload
+from uuid import UUID
 
+from django.core.cache import DEFAULT_CACHE_ALIAS
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage
+from django.core.paginator import InvalidPage
 from django.core.paginator import Page
+from django.core.paginator import PageNotAnInteger
 from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Aggregate
+from django.db.models import Case
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import IntegerField
+from django.db.models import Max
+from django.db.models import Min
+from django.db.models import Model
+from django.db.models import OuterRef
+from django.db.models import Q
+from django.db.models import Subquery
+from django.db.models import Value
+from django.db.models import When
+from django.db.models.expressions import Combinable
+from django.db.models.expressions import OrderBy
+from django.db.models.functions import Trunc
+from django.db.models.lookups import IsNull
+from django.db.models.query import FlatValuesListIterable
 from django.db.models.query import QuerySet
+from django.db.models.query import ValuesListIterable
+from django.utils import timezone
 from django.utils.functional import cached_property
+from django.utils.inspect import method_has_no_args
 
 from ._typing import override
+from .conf import app_settings
 
 if TYPE_CHECKING:
-    from typing import Any
-
     from django.core.paginator import _SupportsPagination
 
 
 _T = TypeVar("_T")
+_M = TypeVar("_M", bound=Model)
+
+TruncKind: TypeAlias = Literal["day", "week", "month"]
+
+
+class _DateBounds(NamedTuple):
+    """The first and last dates of an object_list, in iteration order."""
+
+    first_date: datetime.date | None
+    last_date: datetime.date | None
+    row_count: int
+    chronological: bool
+
+
+class _DateSegments(Sequence[tuple[datetime.date, datetime.date]]):
+    """Fixed width date segments between the first and last dates of an object_list.
+
+    The segments are never materialized, the bounds of any segment are worked out
+    arithmetically from its index, so both `len()` and indexing are O(1) no matter
+    how many pages the date range spans.
+    """
+
+    def __init__(
+        self,
+        first_date: datetime.date,
+        last_date: datetime.date,
+        page_date_range: datetime.timedelta,
+        chronological: bool,
+    ) -> None:
+        self.first_date = first_date
+        self.last_date = last_date
+        self.page_date_range = page_date_range
+        self.chronological = chronological
+        # if chronological, we are moving forward in time through the `object_list`
+        # so every segment is `page_date_range` after the one before it. if not, we
+        # are moving backwards in time, so every segment is `page_date_range` before
+        # the one before it.
+        self.step = page_date_range if chronological else -page_date_range
+        # the number of whole `page_date_range` segments that fit between the first
+        # and last dates
+        self.full_segments = abs(last_date - first_date) // page_date_range
+
+    @override
+    def __len__(self) -> int:
+        # `page_date_range` might not perfectly divide the total span of dates, so
+        # there is always one more segment to cover the remaining dates up to and
+        # including `last_date`
+        return self.full_segments + 1
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[datetime.date, datetime.date]: ...
+
+    @overload
+    def __getitem__(
+        self, index: slice
+    ) -> list[tuple[datetime.date, datetime.date]]: ...
+
+    @override
+    def __getitem__(
+        self, index: int | slice
+    ) -> (
+        tuple[datetime.date, datetime.date] | list[tuple[datetime.date, datetime.date]]
+    ):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("date segment index out of range")
+
+        start_date = self.first_date + self.step * index
+        if index < self.full_segments:
+            return (start_date, start_date + self.step)
+
+        # The last segment captures any dates from the end of the last whole segment
+        # up to and including `last_date`. We add (or subtract, if we are moving
+        # backwards in time) one day to `last_date` to ensure the entire day is covered.
+        one_day = datetime.timedelta(days=1)
+        return (
+            start_date,
+            self.last_date + one_day
+            if self.chronological
+            else self.last_date - one_day,
+        )
+
+    def index_for_date(self, date: datetime.date) -> int | None:
+        """Return the index of the segment holding `date`, if any, arithmetically."""
+        date = _coerce_date(date, self.first_date)
+        offset = (
+            date - self.first_date if self.chronological else self.first_date - date
+        )
+        if offset < datetime.timedelta(0):
+            return None
+
+        index = offset // self.page_date_range
+        if index < self.full_segments:
+            return index
+        if index > self.full_segments:
+            return None
+        _, end_date = self[index]
+        if date < end_date if self.chronological else date > end_date:
+            return index
+        return None
+
+
+_MISSING: Any = object()
+
+_EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_EPOCH = _EPOCH_UTC.replace(tzinfo=None)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+def _date_key(value: datetime.date) -> int:
+    """Map a date or datetime to an integer that sorts the same way."""
+    if isinstance(value, datetime.datetime):
+        epoch = _EPOCH if timezone.is_naive(value) else _EPOCH_UTC
+        return (value - epoch) // _MICROSECOND
+    return value.toordinal()
+
+
+class _DateIndex:
+    """A compact, bisectable index of the dates of an ordered list.
+
+    The dates are pulled out once into an `array` of integer keys, checking the
+    ordering in the same pass, so every page afterwards is an O(log n) bisect and
+    a slice instead of a scan over the whole list. Keys of reverse chronological
+    lists are negated so the array is always ascending.
+    """
+
+    def __init__(self, dates: Iterable[datetime.date]) -> None:
+        keys = array("q")
+        is_ascending = is_descending = True
+        previous: int | None = None
+        for date in dates:
+            key = _date_key(date)
+            if previous is not None:
+                if key < previous:
+                    is_ascending = False
+                elif key > previous:
+                    is_descending = False
+            keys.append(key)
+            previous = key
+
+        self.is_ordered = is_ascending or is_descending
+        # same as comparing the first and last dates, a list of equal dates with
+        # more than one entry is treated as reverse chronological
+        self.chronological = len(keys) <= 1 or keys[0] < keys[-1]
+        if not self.chronological:
+            keys = array("q", (-key for key in keys))
+        self.keys = keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def bisect(self, date: datetime.date) -> int:
+        """Return the position of the first entry at or past `date`, in list order."""
+        key = _date_key(date)
+        return bisect.bisect_left(self.keys, key if self.chronological else -key)
+
+    def slice(self, start_date: datetime.date, end_date: datetime.date) -> slice:
+        """Return the slice of the list between a segment's start and (exclusive) end."""
+        return slice(self.bisect(start_date), self.bisect(end_date))
+
+
+def _coerce_date(value: datetime.date, like: datetime.date) -> datetime.date:
+    """Make `value` comparable with `like`, a date or naive/aware datetime."""
+    if isinstance(like, datetime.datetime):
+        if not isinstance(value, datetime.datetime):
+            value = datetime.datetime.combine(value, datetime.time.min)
+        if timezone.is_aware(like) and timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        elif timezone.is_naive(like) and timezone.is_aware(value):
+            value = timezone.make_naive(value)
+        return value
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        return value.date()
+    return value
+
+
+def _bisect_segments(
+    segments: Sequence[tuple[datetime.date, datetime.date]],
+    date: datetime.date,
+    chronological: bool,
+) -> int | None:
+    """Return the index of the segment holding `date`, if any, by bisecting."""
+    if not segments:
+        return None
+
+    date = _coerce_date(date, segments[0][0])
+    sign = 1 if chronological else -1
+    index = (
+        bisect.bisect_right(
+            segments,
+            sign * _date_key(date),
+            key=lambda segment: sign * _date_key(segment[0]),
+        )
+        - 1
+    )
+    if index < 0:
+        return None
+    _, end_date = segments[index]
+    if date < end_date if chronological else date > end_date:
+        return index
+    return None
+
+
+def _get_default_date_getter(
+    date_field: str, row: Any
+) -> Callable[[Any], datetime.date]:
+    """Read `date_field` by key from mapping rows, by attribute from anything else."""
+    if isinstance(row, Mapping):
+        return operator.itemgetter(date_field)
+    return operator.attrgetter(date_field)
+
+
+class _DensitySegmentsBuilder:
+    """Pick segment boundaries from ordered dates, fed in one at a time.
+
+    A segment is closed once it holds at least `target_per_page` rows and the date
+    changes, as rows sharing a date can never be split across pages. Only the
+    closed segments are kept, so memory grows with the segments, not the rows,
+    whether the dates come from a sync or an async iterator. The pass also sees
+    the bounds and count of the dates, which are filled in along the way.
+    """
+
+    def __init__(self, target_per_page: int) -> None:
+        self.target_per_page = target_per_page
+        self.segments: list[tuple[datetime.date, datetime.date]] = []
+        self.first_date: datetime.date | None = None
+        self.start_date: datetime.date | None = None
+        self.previous_date: datetime.date | None = None
+        self.count = 0
+        self.rows = 0
+
+    def add(self, date: datetime.date) -> None:
+        if self.start_date is None:
+            self.first_date = self.start_date = date
+        elif self.rows >= self.target_per_page and date != self.previous_date:
+            self.segments.append((self.start_date, date))
+            self.start_date = date
+            self.rows = 0
+        self.rows += 1
+        self.count += 1
+        self.previous_date = date
+
+
+def _truncate_date(value: datetime.date, kind: TruncKind) -> datetime.date:
+    """Truncate a date or datetime to its day/week/month, like `Trunc` would."""
+    if isinstance(value, datetime.datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        value = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if kind == "week":
+        return value - datetime.timedelta(days=value.weekday())
+    if kind == "month":
+        return value.replace(day=1)
+    return value
+
+
+def _next_bucket(value: datetime.date, kind: TruncKind) -> datetime.date:
+    """Return the start of the day/week/month after the truncated `value`."""
+    if kind == "week":
+        return value + datetime.timedelta(days=7)
+    if kind == "month":
+        return (value + datetime.timedelta(days=32)).replace(day=1)
+    return value + datetime.timedelta(days=1)
 
 
 class DatePaginator(Generic[_T], Paginator[_T]):
+    # the most pages fetched ahead by `prefetch_pages` kept on a paginator
+    prefetch_cache_size: ClassVar[int] = 16
+
     def __init__(
         self,
         object_list: _SupportsPagination[_T],
         date_field: str,
-        page_date_range: datetime.timedelta,
+        page_date_range: datetime.timedelta | None,
+        *,
+        target_per_page: int | None = None,
+        skip_empty: TruncKind | None = None,
+        date_getter: Callable[[Any], datetime.date] | None = None,
+        prefetch_pages: int = 0,
+        chunk_size: int | None = None,
+        cache_alias: str | None = None,
+        cache_timeout: int | None = None,
+        cache_version: Combinable | None = None,
         **kwargs: Any,
     ) -> None:
+        """
+        Paginate `object_list` into pages spanning `page_date_range` of `date_field`.
+
+        If `target_per_page` is given, page boundaries are instead picked from the
+        distribution of the data so that each page holds roughly `target_per_page`
+        rows, and `page_date_range` may be `None`.
+
+        If `skip_empty` is given ("day", "week" or "month"), each page is one
+        day/week/month and only the ones holding data become pages, and
+        `page_date_range` may be `None`.
+
+        The dates of a list or tuple object_list are read with `date_getter`, e.g.
+        `operator.itemgetter(1)` for rows that are plain tuples. By default they are
+        read from the `date_field` key of mappings, such as the rows of a `.values()`
+        QuerySet, or else from the `date_field` attribute. The dates of a QuerySet
+        are read in the database, except by `prefetch_pages`.
+
+        If `prefetch_pages` is given, `page()` fetches that many of the following
+        pages of a QuerySet in the same range query, split in memory by the dates
+        of the rows, read as for a list. A `.values_list()` QuerySet therefore
+        requires a `date_getter`. The pages are kept on the paginator, the most
+        recently used `prefetch_cache_size` of them, so that asking for them next
+        costs no query.
+
+        If `chunk_size` is given, the pages of a QuerySet are iterated with
+        `.iterator(chunk_size)` rather than loading every row of the page at once,
+        and take their length from a `count()`.
+
+        If `cache_alias` is given, the bounds and segments of a QuerySet are cached
+        across requests in that Django cache, keyed by its SQL and params, for
+        `cache_timeout` seconds (the `CACHE_TIME_DATE_PAGINATOR` setting by
+        default). A `cache_version` aggregate, e.g. `Max("updated_at")`, is checked
+        against the object_list on every use and invalidates the entry when it
+        changes.
+        """
+        if page_date_range is None and target_per_page is None and skip_empty is None:
+            raise ValueError(
+                "DatePaginator requires either a `page_date_range`, a `target_per_page` "
+                "or a `skip_empty`."
+            )
+        if target_per_page is not None and skip_empty is not None:
+            raise ValueError(
+                "`target_per_page` and `skip_empty` cannot be used together."
+            )
+        if target_per_page is not None and target_per_page < 1:
+            raise ValueError("`target_per_page` must be a positive integer.")
+        if skip_empty is not None and skip_empty not in get_args(TruncKind):
+            raise ValueError(
+                f"`skip_empty` must be one of {', '.join(get_args(TruncKind))}."
+            )
+        if prefetch_pages < 0:
+            raise ValueError("`prefetch_pages` must not be negative.")
+        if (
+            prefetch_pages
+            and date_getter is None
+            and isinstance(object_list, QuerySet)
+            and issubclass(
+                object_list._iterable_class,  # pyright: ignore[reportPrivateUsage]
+                ValuesListIterable | FlatValuesListIterable,
+            )
+        ):
+            raise ValueError(
+                "`prefetch_pages` requires a `date_getter` to read the dates of a "
+                "`.values_list()` QuerySet."
+            )
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        if cache_alias is None and (
+            cache_timeout is not None or cache_version is not None
+        ):
+            raise ValueError(
+                "`cache_timeout` and `cache_version` require a `cache_alias`."
+            )
+
         self.date_field = date_field
         self.page_date_range = page_date_range
+        self.target_per_page = target_per_page
+        self.skip_empty = skip_empty
+        self.date_getter = date_getter
+        self.prefetch_pages = prefetch_pages
+        self.chunk_size = chunk_size
+        self.cache_alias = cache_alias
+        self.cache_timeout = cache_timeout
+        self.cache_version = cache_version
+        self._page_summaries: dict[
+            frozenset[tuple[str, Aggregate]], list[DatePageSummary]
+        ] = {}
+        self._prefetched_pages: OrderedDict[int, list[_T]] = OrderedDict()
 
         if kwargs.get("orphans"):
             warnings.warn(
@@ -49,86 +469,506 @@ class DatePaginator(Generic[_T], Paginator[_T]):
         )
 
     @cached_property
-    def date_segments(self) -> list[tuple[datetime.date, datetime.date]]:
-        # Check if the object_list is empty.
-        exists = True
-        # Check for `exists()` first for performance, falling back in case it's not a QuerySet.
-        if hasattr(self.object_list, "exists"):
-            exists = self.object_list.exists()
-        elif not self.object_list:
-            exists = False
-
-        if not exists:
-            return []
+    def _bounds(self) -> _DateBounds:
+        """Discover the date bounds, row count and direction of the object_list.
+
+        For a QuerySet this is a single aggregate query, so `date_segments`,
+        `chronological`, `count` and `num_pages` all share one round trip.
+        """
+        cached = self._cached_state
+        if cached is not None and cached[0] is not None:
+            return cached[0]
 
+        bounds = self._get_bounds()
+        self._store_cached_state(bounds=bounds)
+        return bounds
+
+    def _get_bounds(self) -> _DateBounds:
         if isinstance(self.object_list, QuerySet):
-            first_obj = self.object_list.first()
-            last_obj = self.object_list.last()
-        else:
-            first_obj = self.object_list[0]
-            last_obj = self.object_list[-1]
+            return self._get_bounds_from_aggregate(
+                self.object_list.aggregate(**self._get_bounds_aggregates())
+            )
+
+        count = len(self._date_index)
+        if not count:
+            return _DateBounds(None, None, 0, True)
+        return _DateBounds(
+            self._date_getter(self.object_list[0]),
+            self._date_getter(self.object_list[-1]),
+            count,
+            self._date_index.chronological,
+        )
+
+    def _get_bounds_aggregates(self) -> dict[str, Aggregate]:
+        aggregates: dict[str, Aggregate] = {
+            "date_paginator_min": Min(self.date_field),
+            "date_paginator_max": Max(self.date_field),
+            # counts the rows of `.distinct()` and grouped `.values()` QuerySets
+            # like `QuerySet.count()` does, where `Count("pk")` counts the rows
+            # they are made from
+            "date_paginator_count": Count("*"),
+        }
+        if self._ordering_chronological is None:
+            # the date of the first row in the object_list's own ordering tells
+            # us which of the min/max dates we start from
+            queryset = cast("QuerySet[Any]", self.object_list)
+            head = queryset.values(self.date_field)[:1]
+            aggregates["date_paginator_head"] = Min(Subquery(head))
+        return aggregates
+
+    def _get_bounds_from_aggregate(self, result: dict[str, Any]) -> _DateBounds:
+        count = cast(int, result["date_paginator_count"])
+        if not count:
+            return _DateBounds(None, None, 0, True)
+        min_date = result["date_paginator_min"]
+        max_date = result["date_paginator_max"]
+        chronological = self._ordering_chronological
+        if chronological is None:
+            chronological = count == 1 or result["date_paginator_head"] < max_date
+        if chronological:
+            return _DateBounds(min_date, max_date, count, True)
+        return _DateBounds(max_date, min_date, count, False)
+
+    @cached_property
+    def date_segments(self) -> Sequence[tuple[datetime.date, datetime.date]]:
+        cached = self._cached_state
+        if cached is not None and cached[1] is not None:
+            return cached[1]
+
+        segments = self._get_date_segments()
+        self._store_cached_state(segments=segments)
+        return segments
+
+    @cached_property
+    def _cache_key(self) -> str | None:
+        """The cache key for the bounds and segments of the object_list, if cached."""
+        if self.cache_alias is None or not isinstance(self.object_list, QuerySet):
+            return None
+        try:
+            sql, params = self.object_list.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+
+        digest = hashlib.sha256(
+            f"{self.object_list.db}:{sql}:{params!r}:{self.date_field}:"
+            f"{self.page_date_range!r}:{self.target_per_page}:{self.skip_empty}".encode()
+        )
+        return f"django_twc_toolbox.paginator.date.{digest.hexdigest()}"
+
+    @cached_property
+    def _cache_version_token(self) -> Any:
+        if self.cache_version is None:
+            return None
+        queryset = cast("QuerySet[Any]", self.object_list)
+        return queryset.order_by().aggregate(date_paginator_version=self.cache_version)[
+            "date_paginator_version"
+        ]
+
+    @cached_property
+    def _cached_state(
+        self,
+    ) -> (
+        tuple[_DateBounds | None, Sequence[tuple[datetime.date, datetime.date]] | None]
+        | None
+    ):
+        """The bounds and segments cached by an earlier paginator, if still current."""
+        if self._cache_key is None:
+            return None
+        return self._get_cached_state_from_entry(
+            caches[cast(str, self.cache_alias)].get(self._cache_key)
+        )
+
+    def _get_cached_state_from_entry(
+        self, entry: Any
+    ) -> (
+        tuple[_DateBounds | None, Sequence[tuple[datetime.date, datetime.date]] | None]
+        | None
+    ):
+        if entry is None:
+            return None
+        version, bounds, segments = entry
+        if version != self._cache_version_token:
+            return None
+        return bounds, segments
+
+    def _store_cached_state(
+        self,
+        bounds: _DateBounds | None = None,
+        segments: Sequence[tuple[datetime.date, datetime.date]] | None = None,
+    ) -> None:
+        """Cache the bounds and segments computed so far, for later paginators."""
+        if self._cache_key is None:
+            return
+        caches[cast(str, self.cache_alias)].set(
+            self._cache_key,
+            self._get_cache_entry(bounds, segments),
+            self._get_cache_timeout(),
+        )
+
+    def _get_cache_entry(
+        self,
+        bounds: _DateBounds | None,
+        segments: Sequence[tuple[datetime.date, datetime.date]] | None,
+    ) -> tuple[
+        Any, _DateBounds | None, Sequence[tuple[datetime.date, datetime.date]] | None
+    ]:
+        cached_bounds, cached_segments = self._cached_state or (None, None)
+        if bounds is None:
+            bounds = self.__dict__.get("_bounds", cached_bounds)
+        if segments is None:
+            segments = self.__dict__.get("date_segments", cached_segments)
+        return (self._cache_version_token, bounds, segments)
+
+    def _get_cache_timeout(self) -> int:
+        if self.cache_timeout is not None:
+            return self.cache_timeout
+        return app_settings.CACHE_TIME_DATE_PAGINATOR
+
+    def _get_date_segments(self) -> Sequence[tuple[datetime.date, datetime.date]]:
+        if self.target_per_page is not None:
+            return self._get_density_segments(self.target_per_page, self._iter_dates())
+        if self.skip_empty is not None:
+            return self._get_sparse_segments(
+                self.skip_empty, self._get_sparse_buckets(self.skip_empty)
+            )
+        return self._get_fixed_segments(self._bounds)
+
+    def _get_fixed_segments(
+        self, bounds: _DateBounds
+    ) -> Sequence[tuple[datetime.date, datetime.date]]:
+        first_date, last_date, count, chronological = bounds
+
+        if not count:
+            return []
+
+        return _DateSegments(
+            cast(datetime.date, first_date),
+            cast(datetime.date, last_date),
+            cast(datetime.timedelta, self.page_date_range),
+            chronological,
+        )
+
+    def _get_density_segments(
+        self, target_per_page: int, dates: Iterable[datetime.date]
+    ) -> list[tuple[datetime.date, datetime.date]]:
+        """Pick segment boundaries so each segment holds roughly `target_per_page` rows.
+
+        This is a single ordered pass over the dates of the object_list, see
+        `_DensitySegmentsBuilder`.
+        """
+        builder = _DensitySegmentsBuilder(target_per_page)
+        for date in dates:
+            # rows without a date are on no page
+            if date is not None:
+                builder.add(date)
+        return self._finish_density_segments(builder)
+
+    def _finish_density_segments(
+        self, builder: _DensitySegmentsBuilder
+    ) -> list[tuple[datetime.date, datetime.date]]:
+        """Close the last segment of `builder`, filling in the bounds it has seen."""
+        if builder.start_date is None:
+            self.__dict__.setdefault("_bounds", _DateBounds(None, None, 0, True))
+            return builder.segments
+
+        first_date = cast(datetime.date, builder.first_date)
+        last_date = cast(datetime.date, builder.previous_date)
+        count = builder.count
+        # a QuerySet's direction comes from its ordering, which also covers every
+        # row sharing a single date, only otherwise is it read from the dates
+        chronological = self._ordering_chronological
+        if chronological is None:
+            chronological = count == 1 or first_date < last_date
+        self.__dict__.setdefault(
+            "_bounds", _DateBounds(first_date, last_date, count, chronological)
+        )
 
-        first_date = cast(datetime.date, getattr(first_obj, self.date_field))
-        last_date = cast(datetime.date, getattr(last_obj, self.date_field))
+        # Like the last fixed width segment, the last segment runs one day past
+        # the last date to ensure the entire day is covered.
+        one_day = datetime.timedelta(days=1)
+        return [
+            *builder.segments,
+            (
+                builder.start_date,
+                last_date + one_day if chronological else last_date - one_day,
+            ),
+        ]
 
+    def _get_sparse_buckets(self, kind: TruncKind) -> Iterable[datetime.date]:
+        """Return the starts of the days/weeks/months of `kind` holding any data.
+
+        For a QuerySet the non-empty buckets come from a single GROUP BY over the
+        truncated date, so empty buckets never become pages. Rows without a date
+        are on no page, so they make no bucket either.
+        """
+        if isinstance(self.object_list, QuerySet):
+            return (
+                self._get_dated_queryset()
+                .order_by()
+                .annotate(date_paginator_bucket=Trunc(self.date_field, kind))
+                .values_list("date_paginator_bucket", flat=True)
+                .distinct()
+                .order_by(
+                    "date_paginator_bucket"
+                    if self.chronological
+                    else "-date_paginator_bucket"
+                )
+            )
+        return (
+            bucket
+            for bucket, _ in itertools.groupby(
+                _truncate_date(date, kind)
+                for date in self._iter_dates()
+                if date is not None
+            )
+        )
+
+    def _get_sparse_segments(
+        self, kind: TruncKind, buckets: Iterable[datetime.date]
+    ) -> list[tuple[datetime.date, datetime.date]]:
+        """Build one segment per non-empty day/week/month bucket of `kind`."""
         segments: list[tuple[datetime.date, datetime.date]] = []
-        current_start_date = first_date
-        if self.chronological:
-            # if chronological, we are moving forward in time through the `object_list`
-            # so any time we need to get the next segment's end date, we need to
-            # add the date_range. to start we add the date_range to the first date.
-            # basically any time we need to get the next segment or move the date
-            # goalpost, we use addition
-            current_end_date = first_date + self.page_date_range
-            # less than or equal because we are moving forwards in time and dates
-            # in the future are greater than dates in the past
-            # yesterday < today < tomorrow
-            while current_end_date <= last_date:
-                segments.append((current_start_date, current_end_date))
-                current_start_date = current_end_date
-                # add because we are moving forwards in time
-                current_end_date += self.page_date_range
-            # Append the last segment to cover any remaining dates not included in the
-            # previous segments. This is necessary because the date range defined by
-            # `date_range` might not perfectly divide the total span of dates. This final
-            # segment captures any dates from the end of the last segment up to and
-            # including `last_date`. We add one day to `last_date` to ensure the entire
-            # day is covered.
-            segments.append(
-                (current_start_date, last_date + datetime.timedelta(days=1))
+        for bucket in buckets:
+            next_bucket = _next_bucket(bucket, kind)
+            if self.chronological:
+                segments.append((bucket, next_bucket))
+            else:
+                # moving backwards in time the start of a segment is inclusive and
+                # the end exclusive, so step both back by the smallest unit the
+                # dates can hold to keep the bucket's own range
+                resolution = (
+                    datetime.timedelta(microseconds=1)
+                    if isinstance(bucket, datetime.datetime)
+                    else datetime.timedelta(days=1)
+                )
+                segments.append((next_bucket - resolution, bucket - resolution))
+        return segments
+
+    def _iter_dates(self) -> Iterator[datetime.date]:
+        """Iterate over the dates of the object_list, in order.
+
+        Rows of a QuerySet without a date are left out, as they are on no page.
+        """
+        if isinstance(self.object_list, QuerySet):
+            return (
+                self._get_dated_queryset()
+                .values_list(self.date_field, flat=True)
+                .iterator()
             )
+        return map(self._date_getter, self.object_list)
+
+    def _get_dated_queryset(self) -> QuerySet[Any]:
+        """Return the rows of a QuerySet object_list that have a date."""
+        queryset = cast("QuerySet[Any]", self.object_list)
+        return queryset.filter(**{f"{self.date_field}__isnull": False})
+
+    @cached_property
+    def _date_getter(self) -> Callable[[Any], datetime.date]:
+        """Read the date of a row of a list or tuple object_list."""
+        if self.date_getter is not None:
+            return self.date_getter
+        return _get_default_date_getter(
+            self.date_field, self.object_list[0] if len(self.object_list) else None
+        )
+
+    def page_summaries(self, **aggregates: Aggregate) -> list[DatePageSummary]:
+        """Return the row count, and any `aggregates`, of every page.
+
+        For a QuerySet this is a single query, each row is bucketed into its page
+        with a `CASE` over the segment bounds and grouped by page, rows without a
+        date are left out. Pages without any rows are included with a count of 0.
+        The result is cached on the paginator for each set of `aggregates`::
+
+            paginator.page_summaries(total=Sum("amount"), average=Avg("amount"))
+
+        Aggregates are only supported when paginating a QuerySet.
+        """
+        key = frozenset(aggregates.items())
+        if key in self._page_summaries:
+            return self._page_summaries[key]
+
+        segments = self.date_segments
+        counts = [0] * len(segments)
+        values: list[dict[str, Any]] = [
+            {
+                name: getattr(aggregate, "empty_result_set_value", None)
+                for name, aggregate in aggregates.items()
+            }
+            for _ in segments
+        ]
+
+        if isinstance(self.object_list, QuerySet):
+            if segments:
+                rows = (
+                    self._get_dated_queryset()
+                    .order_by()
+                    .annotate(date_paginator_page=self._get_page_number(segments))
+                    .values("date_paginator_page")
+                    .annotate(date_paginator_count=Count("pk"), **aggregates)
+                    .order_by()
+                )
+                for row in rows:
+                    number = row.pop("date_paginator_page")
+                    if number is None:
+                        # rows past the last segment, added since the segments
+                        # were cached, belong to no page
+                        continue
+                    index = number - 1
+                    counts[index] = row.pop("date_paginator_count")
+                    values[index].update(row)
         else:
-            # if not chronological, it means we are moving backwards in time through
-            # the `object_list` so this time we subtract the date_range to get the
-            # next segment's end date. to start we subtract the date_range from the
-            # first date. opposite to above, any time we need to get the next segment
-            # or move the date goalpost, we use subtraction
-            current_end_date = first_date - self.page_date_range
-            # greater than or equal because we are moving backwards in time
-            # tomorrow > today > yesterday
-            while current_end_date >= last_date:
-                segments.append((current_start_date, current_end_date))
-                current_start_date = current_end_date
-                # subtract because we are moving backwards in time
-                current_end_date -= self.page_date_range
-
-            # Append the last segment to cover the remaining dates, similar to above.
-            # We subtract one day from `last_date` to ensure the entire day is covered.
-            segments.append(
-                (current_start_date, last_date - datetime.timedelta(days=1))
+            if aggregates:
+                raise ValueError(
+                    "DatePaginator only supports page summary aggregates when "
+                    "paginating a QuerySet."
+                )
+            for index, (start_date, end_date) in enumerate(segments):
+                page_slice = self._date_index.slice(start_date, end_date)
+                counts[index] = page_slice.stop - page_slice.start
+
+        summaries = [
+            DatePageSummary(
+                number=number,
+                start_date=start_date,
+                end_date=end_date,
+                count=counts[number - 1],
+                aggregates=values[number - 1],
             )
+            for number, (start_date, end_date) in enumerate(segments, start=1)
+        ]
+        self._page_summaries[key] = summaries
+        return summaries
 
-        return segments
+    def _get_page_number(
+        self, segments: Sequence[tuple[datetime.date, datetime.date]]
+    ) -> Case:
+        """Return the page number of each row of `segments` as an expression.
+
+        Segments are in order and cover every row, so a row belongs to the first
+        segment whose (exclusive) end it has not reached yet. This is found with a
+        `CASE` nested as a binary search over the segment ends, costing each row
+        O(log pages) comparisons, though every segment end is still sent as a
+        parameter. Rows past the last segment, e.g. added since the segments were
+        cached, get no page number.
+        """
+        lookup = f"{self.date_field}__{'lt' if self.chronological else 'gt'}"
+
+        def search(first: int, last: int) -> Case | Value:
+            if first == last:
+                return Value(first)
+            middle = (first + last) // 2
+            _, end_date = segments[middle - 1]
+            return Case(
+                When(**{lookup: end_date}, then=search(first, middle)),
+                default=search(middle + 1, last),
+                output_field=IntegerField(),
+            )
+
+        _, last_end_date = segments[-1]
+        return Case(
+            When(**{lookup: last_end_date}, then=search(1, len(segments))),
+            output_field=IntegerField(),
+        )
 
     @override
     def page(self, number: int | str) -> DatePage[_T]:
         number = self.validate_number(number)
         start_date, end_date = self.date_segments[number - 1]
 
-        object_list = self._get_page_object_list_for_range(start_date, end_date)
+        object_list: QuerySet[Any] | list[Any]
+        if number in self._prefetched_pages:
+            self._prefetched_pages.move_to_end(number)
+            object_list = self._prefetched_pages[number]
+        elif (last_number := self._get_prefetch_last_number(number)) > number:
+            rows = list(self._get_prefetch_object_list(number, last_number))
+            object_list = self._split_prefetched_rows(number, last_number, rows)
+        else:
+            object_list = self._get_page_object_list_for_range(start_date, end_date)
 
         return self._get_page(object_list, number, self, start_date, end_date)
 
+    def _get_prefetch_last_number(self, number: int) -> int:
+        """Return the number of the last page to fetch along with page `number`."""
+        if not self.prefetch_pages or not isinstance(self.object_list, QuerySet):
+            return number
+        return min(number + self.prefetch_pages, self.num_pages)
+
+    def _get_prefetch_object_list(
+        self, number: int, last_number: int
+    ) -> QuerySet[Any] | list[Any]:
+        """Return the rows of pages `number` to `last_number` in one range."""
+        start_date, _ = self.date_segments[number - 1]
+        _, end_date = self.date_segments[last_number - 1]
+        return self._get_page_object_list_for_range(start_date, end_date)
+
+    def _split_prefetched_rows(
+        self, number: int, last_number: int, rows: list[_T]
+    ) -> list[_T]:
+        """Split the rows of pages `number` to `last_number` by page, keeping the
+        pages after `number` for later and returning the rows of page `number`.
+        """
+        get_date = self.date_getter or _get_default_date_getter(
+            self.date_field, rows[0] if rows else None
+        )
+        pages: list[list[_T]] = [[] for _ in range(number, last_number + 1)]
+        index = 0
+        for row in rows:
+            date = get_date(row)
+            # rows are in date order, so move on to the page holding this row
+            while index < len(pages) - 1:
+                _, end_date = self.date_segments[number + index - 1]
+                if date < end_date if self.chronological else date > end_date:
+                    break
+                index += 1
+            pages[index].append(row)
+
+        for offset, page_rows in enumerate(pages[1:], start=1):
+            self._prefetched_pages[number + offset] = page_rows
+            self._prefetched_pages.move_to_end(number + offset)
+        while len(self._prefetched_pages) > self.prefetch_cache_size:
+            self._prefetched_pages.popitem(last=False)
+        return pages[0]
+
+    def get_elided_date_range(
+        self, number: int | str = 1, *, on_each_side: int = 3, on_ends: int = 2
+    ) -> Iterator[DatePageLink | str]:
+        """Return `get_elided_page_range()` with the dates of each page.
+
+        Every page number becomes a `DatePageLink` of its number and start/end
+        dates, ellipses are passed through as is. Only the visible pages are looked
+        up in `date_segments`, which are worked out arithmetically when the pages
+        have a fixed `page_date_range`.
+        """
+        for page_number in self.get_elided_page_range(
+            number, on_each_side=on_each_side, on_ends=on_ends
+        ):
+            if not isinstance(page_number, int):
+                yield page_number
+                continue
+            start_date, end_date = self.date_segments[page_number - 1]
+            yield DatePageLink(page_number, start_date, end_date)
+
+    def number_for_date(self, date: datetime.date) -> int:
+        """Return the number of the page holding `date`.
+
+        Works from the cached bounds or segments, so no page needs to be fetched.
+        Raises `EmptyPage` if `date` falls outside every page, e.g. before the
+        first date or, with `skip_empty`, in a day/week/month without data.
+        """
+        segments = self.date_segments
+        if isinstance(segments, _DateSegments):
+            index = segments.index_for_date(date)
+        else:
+            index = _bisect_segments(segments, date, self.chronological)
+
+        if index is None:
+            raise EmptyPage(self.error_messages["no_results"])
+        return index + 1
+
+    def page_for_date(self, date: datetime.date) -> DatePage[_T]:
+        """Return the page holding `date`."""
+        return self.page(self.number_for_date(date))
+
     def _get_page_object_list_for_range(
         self, start_date: datetime.date, end_date: datetime.date
     ) -> QuerySet[Any] | list[Any]:
@@ -149,20 +989,9 @@ class DatePaginator(Generic[_T], Paginator[_T]):
 
             object_list = self.object_list.filter(**filter_kwargs)
         else:
-            if self.chronological:
-                object_list = [
-                    obj
-                    for obj in self.object_list
-                    # yesterday < today < tomorrow
-                    if start_date <= getattr(obj, self.date_field) < end_date
-                ]
-            else:
-                object_list = [
-                    obj
-                    for obj in self.object_list
-                    # tomorrow > today > yesterday
-                    if start_date >= getattr(obj, self.date_field) > end_date
-                ]
+            object_list = list(
+                self.object_list[self._date_index.slice(start_date, end_date)]
+            )
 
         return object_list
 
@@ -181,37 +1010,200 @@ class DatePaginator(Generic[_T], Paginator[_T]):
         - e.g. [tomorrow, today, yesterday]
         - tomorrow > yesterday
         - would return False
-        """
-        if self.count == 1:
-            return True
 
+        For a QuerySet this is read straight from its ordering, without touching
+        the database, falling back to the first and last dates only if the
+        ordering is ambiguous.
+        """
         if isinstance(self.object_list, QuerySet):
-            first_obj = self.object_list.first()
-            last_obj = self.object_list.last()
-        else:
-            first_obj = self.object_list[0]
-            last_obj = self.object_list[-1]
+            chronological = self._ordering_chronological
+            if chronological is not None:
+                return chronological
+        return self._bounds.chronological
 
-        first_date = getattr(first_obj, self.date_field)
-        last_date = getattr(last_obj, self.date_field)
+    @cached_property
+    def _ordering_chronological(self) -> bool | None:
+        """Read the direction of a QuerySet object_list from its ordering.
+
+        Returns `None` if the object_list is not a QuerySet or if its ordering
+        references `date_field` in both directions.
+        """
+        if not isinstance(self.object_list, QuerySet):
+            return None
+
+        directions = set(self._get_ordering_directions())
+        if len(directions) != 1:
+            return None
 
-        return first_date < last_date
+        (ascending,) = directions
+        # `QuerySet.reverse()` flips the ordering without touching `order_by`
+        return ascending is self.object_list.query.standard_ordering
+
+    def _get_ordering_directions(self) -> Iterator[bool]:
+        """Yield whether each ordering on `date_field` is ascending, in order."""
+        query = cast("QuerySet[Any]", self.object_list).query
+        for ordering in query.order_by:
+            if isinstance(ordering, str):
+                if ordering == self.date_field:
+                    yield True
+                elif ordering == f"-{self.date_field}":
+                    yield False
+            elif (
+                isinstance(ordering, OrderBy)
+                and isinstance(ordering.expression, F)
+                and ordering.expression.name == self.date_field  # type: ignore[attr-defined]
+            ):
+                yield not ordering.descending
+            elif isinstance(ordering, F) and ordering.name == self.date_field:  # type: ignore[attr-defined]
+                yield True
+
+    @cached_property
+    def count(self) -> int:
+        return self._bounds.row_count
 
     def _get_page(self, *args: Any, **kwargs: Any) -> DatePage[_T]:
-        return DatePage(*args, **kwargs)
+        return DatePage(*args, chunk_size=self.chunk_size, **kwargs)
 
     @cached_property
     def num_pages(self) -> int:
         return len(self.date_segments)
 
+    # The async API below fills the same cached properties as the sync API using
+    # Django's async QuerySet and cache methods, so that once awaited the sync
+    # properties, `page()` and templates can be used without touching the database.
+
+    async def acount(self) -> int:
+        if "count" not in self.__dict__:
+            self.__dict__["count"] = (await self._abounds()).row_count
+        return self.count
+
+    async def anum_pages(self) -> int:
+        if "num_pages" not in self.__dict__:
+            self.__dict__["num_pages"] = len(await self.adate_segments())
+        return self.num_pages
+
+    async def achronological(self) -> bool:
+        if "chronological" not in self.__dict__:
+            chronological = self._ordering_chronological
+            if chronological is None:
+                chronological = (await self._abounds()).chronological
+            self.__dict__["chronological"] = chronological
+        return self.chronological
+
+    async def adate_segments(self) -> Sequence[tuple[datetime.date, datetime.date]]:
+        if "date_segments" in self.__dict__ or not isinstance(
+            self.object_list, QuerySet
+        ):
+            return self.date_segments
+
+        await self._aload_cached_state()
+        cached = self._cached_state
+        if cached is not None and cached[1] is not None:
+            segments = cached[1]
+        else:
+            if self.target_per_page is not None:
+                dates = self._get_dated_queryset().values_list(
+                    self.date_field, flat=True
+                )
+                builder = _DensitySegmentsBuilder(self.target_per_page)
+                async for date in dates.aiterator():
+                    builder.add(date)
+                segments = self._finish_density_segments(builder)
+            elif self.skip_empty is not None:
+                await self.achronological()
+                buckets = cast(
+                    "QuerySet[Any, datetime.date]",
+                    self._get_sparse_buckets(self.skip_empty),
+                )
+                segments = self._get_sparse_segments(
+                    self.skip_empty, [bucket async for bucket in buckets]
+                )
+            else:
+                segments = self._get_fixed_segments(await self._abounds())
+            await self._astore_cached_state(segments=segments)
+
+        self.__dict__["date_segments"] = segments
+        return segments
+
+    async def apage(self, number: int | str) -> DatePage[_T]:
+        await self.anum_pages()
+        await self.achronological()
+
+        number = self.validate_number(number)
+        last_number = self._get_prefetch_last_number(number)
+        if number not in self._prefetched_pages and last_number > number:
+            object_list = self._get_prefetch_object_list(number, last_number)
+            rows = [row async for row in cast("QuerySet[Any]", object_list)]
+            start_date, end_date = self.date_segments[number - 1]
+            return self._get_page(
+                self._split_prefetched_rows(number, last_number, rows),
+                number,
+                self,
+                start_date,
+                end_date,
+            )
+        return self.page(number)
+
+    async def aget_page(self, number: int | str | None) -> DatePage[_T]:
+        """Return a valid page like `get_page()`, even if `number` is out of range."""
+        await self.anum_pages()
+        try:
+            number = self.validate_number(cast(int, number))
+        except PageNotAnInteger:
+            number = 1
+        except EmptyPage:
+            number = self.num_pages
+        return await self.apage(number)
+
+    async def _abounds(self) -> _DateBounds:
+        if "_bounds" in self.__dict__ or not isinstance(self.object_list, QuerySet):
+            return self._bounds
+
+        await self._aload_cached_state()
+        cached = self._cached_state
+        if cached is not None and cached[0] is not None:
+            bounds = cached[0]
+        else:
+            bounds = self._get_bounds_from_aggregate(
+                await self.object_list.aaggregate(**self._get_bounds_aggregates())
+            )
+            await self._astore_cached_state(bounds=bounds)
+
+        self.__dict__["_bounds"] = bounds
+        return bounds
+
+    async def _aload_cached_state(self) -> None:
+        if "_cached_state" in self.__dict__ or self._cache_key is None:
+            return
+        if self.cache_version is not None and (
+            "_cache_version_token" not in self.__dict__
+        ):
+            queryset = cast("QuerySet[Any]", self.object_list)
+            result = await queryset.order_by().aaggregate(
+                date_paginator_version=self.cache_version
+            )
+            self.__dict__["_cache_version_token"] = result["date_paginator_version"]
+        self.__dict__["_cached_state"] = self._get_cached_state_from_entry(
+            await caches[cast(str, self.cache_alias)].aget(self._cache_key)
+        )
+
+    async def _astore_cached_state(
+        self,
+        bounds: _DateBounds | None = None,
+        segments: Sequence[tuple[datetime.date, datetime.date]] | None = None,
+    ) -> None:
+        if self._cache_key is None:
+            return
+        await caches[cast(str, self.cache_alias)].aset(
+            self._cache_key,
+            self._get_cache_entry(bounds, segments),
+            self._get_cache_timeout(),
+        )
+
     def _check_object_list_is_ordered(self):
         """Ensure that the object_list is ordered by date_field"""
         if isinstance(self.object_list, QuerySet):  # pyright: ignore[reportUnknownMemberType]
-            ordering_fields = self.object_list.query.order_by
-            if not ordering_fields or not any(
-                field in [self.date_field, f"-{self.date_field}"]
-                for field in ordering_fields
-            ):
+            if next(self._get_ordering_directions(), None) is None:
                 raise ValueError(
                     f"Paginator received an unordered object_list: {self.object_list}. "
                     "DatePaginator only supports ordered object_list instances. "
@@ -220,22 +1212,136 @@ class DatePaginator(Generic[_T], Paginator[_T]):
                     f"or .order_by('-{self.date_field}') on the queryset."
                 )
         else:
-            # For lists, check if elements are in ascending or descending order by date_field
-            is_ascending = all(
-                getattr(x, self.date_field) <= getattr(y, self.date_field)
-                for x, y in zip(self.object_list, self.object_list[1:], strict=False)
-            )
-            is_descending = all(
-                getattr(x, self.date_field) >= getattr(y, self.date_field)
-                for x, y in zip(self.object_list, self.object_list[1:], strict=False)
-            )
-            if not (is_ascending or is_descending):
+            # For lists, check if elements are in ascending or descending order by
+            # date_field while indexing their dates for bisecting pages later on
+            self._date_index = _DateIndex(self._iter_dates())
+            if not self._date_index.is_ordered:
                 raise ValueError(
                     "Paginator received an unordered list. DatePaginator only supports "
                     f"lists that are ordered by the specified `date_field` - {self.date_field}."
                 )
 
 
+class GroupedDatePaginator(Mapping[Any, DatePaginator[_T]]):
+    """Paginate each group of a QuerySet by `page_date_range` of `date_field`.
+
+    Rather than every group's `DatePaginator` discovering its own bounds, the
+    first/last dates and row count of all groups come from a single aggregate
+    query grouped by `group_by`. It maps each group's `group_by` value to a
+    `DatePaginator` over that group, preseeded with its bounds, so `count`,
+    `num_pages` and `date_segments` of any group cost no further query.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet[Any],
+        date_field: str,
+        page_date_range: datetime.timedelta,
+        group_by: str,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Paginate `object_list` by `group_by`, any other keyword arguments are passed
+        on to each group's `DatePaginator`.
+        """
+        if not isinstance(object_list, QuerySet):
+            raise TypeError("GroupedDatePaginator only supports QuerySet object_lists.")
+        if kwargs.get("target_per_page") is not None or kwargs.get("skip_empty"):
+            raise ValueError(
+                "GroupedDatePaginator only supports a fixed `page_date_range`."
+            )
+
+        self.object_list = object_list
+        self.date_field = date_field
+        self.page_date_range = page_date_range
+        self.group_by = group_by
+        self.paginator_kwargs = kwargs
+        self._paginators: dict[Any, DatePaginator[_T]] = {}
+        # checks the ordering of the object_list, without any queries
+        self._paginator: DatePaginator[_T] = DatePaginator(
+            object_list, date_field, page_date_range, **kwargs
+        )
+
+    @cached_property
+    def _group_bounds(self) -> dict[Any, _DateBounds]:
+        """Discover the bounds of every group with a single grouped aggregate query."""
+        aggregates = self._paginator._get_bounds_aggregates()
+        if "date_paginator_head" in aggregates:
+            # the direction of an ambiguous ordering is read from the first row
+            # of each group, rather than of the whole object_list. `NULL = NULL` is
+            # never true, so the NULL group is matched separately
+            head = self.object_list.filter(
+                Q(**{self.group_by: OuterRef(self.group_by)})
+                | Q(
+                    IsNull(OuterRef(self.group_by), True),
+                    **{f"{self.group_by}__isnull": True},
+                )
+            ).values(self.date_field)[:1]
+            aggregates["date_paginator_head"] = Min(Subquery(head))
+
+        rows = (
+            self.object_list.order_by()
+            .values(self.group_by)
+            .annotate(**aggregates)
+            .order_by(self.group_by)
+        )
+        return {
+            row[self.group_by]: self._paginator._get_bounds_from_aggregate(row)
+            for row in rows
+        }
+
+    @property
+    def groups(self) -> list[Any]:
+        """The `group_by` values of the object_list, in order."""
+        return list(self._group_bounds)
+
+    @cached_property
+    def page_counts(self) -> dict[Any, int]:
+        """The number of pages of every group."""
+        return {group: paginator.num_pages for group, paginator in self.items()}
+
+    @override
+    def __getitem__(self, group: Any) -> DatePaginator[_T]:
+        if group not in self._paginators:
+            bounds = self._group_bounds[group]
+            paginator: DatePaginator[_T] = DatePaginator(
+                self.object_list.filter(**{self.group_by: group}),
+                self.date_field,
+                self.page_date_range,
+                **self.paginator_kwargs,
+            )
+            paginator.__dict__["_bounds"] = bounds
+            self._paginators[group] = paginator
+        return self._paginators[group]
+
+    @override
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._group_bounds)
+
+    @override
+    def __len__(self) -> int:
+        return len(self._group_bounds)
+
+
+class DatePageLink(NamedTuple):
+    """The number and start/end dates of a page, for labelling a link to it."""
+
+    number: int
+    start_date: datetime.date
+    end_date: datetime.date
+
+
+@dataclass(frozen=True)
+class DatePageSummary:
+    """The row count and aggregates of a single page of a `DatePaginator`."""
+
+    number: int
+    start_date: datetime.date
+    end_date: datetime.date
+    count: int
+    aggregates: dict[str, Any] = field(default_factory=dict)
+
+
 class DatePage(Page[_T]):
     def __init__(
         self,
@@ -244,10 +1350,34 @@ class DatePage(Page[_T]):
         paginator: DatePaginator[_T],
         start_date: datetime.datetime,
         end_date: datetime.datetime,
+        *,
+        chunk_size: int | None = None,
     ) -> None:
         super().__init__(object_list, number, paginator)
         self.start_date = start_date
         self.end_date = end_date
+        self.chunk_size = chunk_size
+
+    @property
+    def _is_streamed(self) -> bool:
+        return self.chunk_size is not None and isinstance(self.object_list, QuerySet)
+
+    @cached_property
+    def _count(self) -> int:
+        return cast("QuerySet[Any]", self.object_list).count()
+
+    @override
+    def __len__(self) -> int:
+        if self._is_streamed:
+            return self._count
+        return super().__len__()
+
+    @override
+    def __iter__(self) -> Iterator[_T]:
+        if self._is_streamed:
+            queryset = cast("QuerySet[Any]", self.object_list)
+            return queryset.iterator(chunk_size=self.chunk_size)
+        return super().__iter__()
 
     @cached_property
     def min_date(self) -> datetime.datetime:
@@ -260,3 +1390,651 @@ class DatePage(Page[_T]):
     @cached_property
     def date_range(self) -> tuple[datetime.datetime, datetime.datetime]:
         return (self.min_date, self.max_date)
+
+    async def __aiter__(self) -> AsyncIterator[_T]:
+        if self._is_streamed:
+            queryset = cast("QuerySet[Any]", self.object_list)
+            async for obj in queryset.aiterator(chunk_size=cast(int, self.chunk_size)):
+                yield obj
+        elif isinstance(self.object_list, QuerySet):
+            async for obj in self.object_list:
+                yield obj
+        else:
+            for obj in self.object_list:
+                yield obj
+
+
+class StreamingDatePaginator(Generic[_T]):
+    """Paginate an ordered iterable by `page_date_range` of `date_field` in one pass.
+
+    Unlike `DatePaginator`, the object_list is never indexed or counted, so it can
+    be a generator, a file of rows or a QuerySet read through a server-side cursor
+    with `.iterator()`. Iterating the paginator groups the rows into the same
+    pages `DatePaginator` would build, groupby-style, yielding each `DatePage` as
+    soon as the first row past it is read. Only the rows of the current page are
+    held in memory, and the object_list can only be iterated once.
+
+    As the whole object_list is never seen up front, an unordered object_list only
+    raises `ValueError` once the first out of order row is reached.
+    """
+
+    def __init__(
+        self,
+        object_list: Iterable[_T],
+        date_field: str,
+        page_date_range: datetime.timedelta,
+        *,
+        date_getter: Callable[[Any], datetime.date] | None = None,
+        chunk_size: int = 2000,
+    ) -> None:
+        """
+        Paginate `object_list`, read with `.iterator(chunk_size)` if it is a
+        QuerySet. The dates of its rows are read with `date_getter` or, by default,
+        from the `date_field` key of mappings or else the `date_field` attribute.
+        """
+        if page_date_range <= datetime.timedelta(0):
+            raise ValueError("`page_date_range` must be a positive timedelta.")
+
+        self.object_list = object_list
+        self.date_field = date_field
+        self.page_date_range = page_date_range
+        self.date_getter = date_getter
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[StreamingDatePage[_T]]:
+        if isinstance(self.object_list, QuerySet):
+            rows = self.object_list.iterator(chunk_size=self.chunk_size)
+        else:
+            rows = iter(self.object_list)
+
+        first_row = next(rows, _MISSING)
+        if first_row is _MISSING:
+            return
+        get_date = self.date_getter or _get_default_date_getter(
+            self.date_field, first_row
+        )
+        first_date = get_date(first_row)
+
+        # Rows sharing the first date are all on the first page, read past them
+        # to the first different date to find out which way the rows are ordered.
+        object_list = [first_row]
+        row = next(rows, _MISSING)
+        while row is not _MISSING and get_date(row) == first_date:
+            object_list.append(row)
+            row = next(rows, _MISSING)
+
+        if row is _MISSING:
+            # same as `DatePaginator`, a single date with more than one entry is
+            # treated as reverse chronological
+            chronological = len(object_list) == 1
+        else:
+            chronological = get_date(row) > first_date
+        step = self.page_date_range if chronological else -self.page_date_range
+
+        number = 1
+        previous_date = first_date
+        rows_before = 0
+        while True:
+            start_date = first_date + step * (number - 1)
+            end_date = start_date + step
+            while row is not _MISSING:
+                date = get_date(row)
+                if date < previous_date if chronological else date > previous_date:
+                    raise ValueError(
+                        "StreamingDatePaginator received an object_list that is not "
+                        f"ordered by {self.date_field}."
+                    )
+                if date >= end_date if chronological else date <= end_date:
+                    break
+                object_list.append(row)
+                previous_date = date
+                row = next(rows, _MISSING)
+
+            if row is _MISSING:
+                # the last page runs one day past the last date to ensure the
+                # entire day is covered, like the last page of `DatePaginator`
+                one_day = datetime.timedelta(days=1)
+                yield StreamingDatePage(
+                    object_list,
+                    number,
+                    self,
+                    start_date,
+                    previous_date + one_day
+                    if chronological
+                    else previous_date - one_day,
+                    has_next=False,
+                    rows_before=rows_before,
+                )
+                return
+
+            yield StreamingDatePage(
+                object_list,
+                number,
+                self,
+                start_date,
+                end_date,
+                has_next=True,
+                rows_before=rows_before,
+            )
+            rows_before += len(object_list)
+            object_list = []
+            number += 1
+
+
+class StreamingDatePage(DatePage[_T]):
+    def __init__(
+        self,
+        object_list: list[_T],
+        number: int,
+        paginator: StreamingDatePaginator[_T],
+        start_date: datetime.date,
+        end_date: datetime.date,
+        *,
+        has_next: bool,
+        rows_before: int,
+    ) -> None:
+        super().__init__(
+            object_list,
+            number,
+            paginator,  # type: ignore[arg-type]
+            start_date,  # type: ignore[arg-type]
+            end_date,  # type: ignore[arg-type]
+        )
+        self._has_next = has_next
+        self._rows_before = rows_before
+
+    @override
+    def __repr__(self) -> str:
+        return f"<Page {self.number}>"
+
+    @override
+    def has_next(self) -> bool:
+        return self._has_next
+
+    @override
+    def next_page_number(self) -> int:
+        if not self._has_next:
+            raise EmptyPage(Paginator.default_error_messages["no_results"])
+        return self.number + 1
+
+    @override
+    def previous_page_number(self) -> int:
+        if not self.has_previous():
+            raise EmptyPage(Paginator.default_error_messages["min_page"])
+        return self.number - 1
+
+    @override
+    def start_index(self) -> int:
+        """Return the 1-based position of the first row of this page in the stream."""
+        if not self.object_list:
+            return 0
+        return self._rows_before + 1
+
+    @override
+    def end_index(self) -> int:
+        """Return the 1-based position of the last row of this page in the stream."""
+        return self._rows_before + len(self.object_list)
+
+
+class CountStrategy:
+    """Work out the total number of objects in a paginator's object_list."""
+
+    # whether the count may be estimated or stale, in which case the paginator
+    # lets pages past it through rather than raising `EmptyPage`
+    approximate: ClassVar[bool] = False
+
+    def count(self, object_list: _SupportsPagination[Any]) -> int:
+        # same as `django.core.paginator.Paginator.count`
+        c = getattr(object_list, "count", None)
+        if callable(c) and not inspect.isbuiltin(c) and method_has_no_args(c):
+            return cast(int, c())
+        return len(object_list)
+
+
+class ExactCount(CountStrategy):
+    """Count the object_list exactly, every time."""
+
+
+class CachedCount(CountStrategy):
+    """Count a QuerySet exactly, caching the count in a Django cache.
+
+    The cache key is derived from the compiled SQL and params of the QuerySet, so
+    each distinct filter gets its own count. The count may be stale for up to
+    `timeout` seconds, which defaults to the `CACHE_TIME_PAGINATOR_COUNT` setting.
+    """
+
+    approximate = True
+
+    def __init__(
+        self, timeout: int | None = None, cache_alias: str = DEFAULT_CACHE_ALIAS
+    ) -> None:
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+
+    @override
+    def count(self, object_list: _SupportsPagination[Any]) -> int:
+        if not isinstance(object_list, QuerySet):
+            return super().count(object_list)
+
+        try:
+            sql, params = object_list.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+
+        digest = hashlib.sha256(f"{object_list.db}:{sql}:{params!r}".encode())
+        key = f"django_twc_toolbox.paginator.count.{digest.hexdigest()}"
+        cache = caches[self.cache_alias]
+
+        count = cache.get(key)
+        if count is None:
+            count = super().count(object_list)
+            timeout = (
+                self.timeout
+                if self.timeout is not None
+                else app_settings.CACHE_TIME_PAGINATOR_COUNT
+            )
+            cache.set(key, count, timeout)
+        return cast(int, count)
+
+
+class EstimatedCount(CountStrategy):
+    """Use the query planner's row estimate for a QuerySet, where there is one.
+
+    Only PostgreSQL's planner estimate is supported, every other backend (and
+    object_lists that are not QuerySets) falls back to an exact count. Estimates
+    below `threshold` are also replaced by an exact count, as small counts are
+    cheap and an estimate is most visibly wrong there.
+    """
+
+    approximate = True
+
+    def __init__(self, threshold: int = 1000) -> None:
+        self.threshold = threshold
+
+    @override
+    def count(self, object_list: _SupportsPagination[Any]) -> int:
+        estimate = None
+        if isinstance(object_list, QuerySet):
+            estimate = self.estimate(object_list)
+        if estimate is None or estimate < self.threshold:
+            return super().count(object_list)
+        return estimate
+
+    def estimate(self, queryset: QuerySet[Any]) -> int | None:
+        """Return the planner's row estimate for `queryset`, if the backend has one."""
+        if connections[queryset.db].vendor != "postgresql":
+            return None
+        try:
+            plan = json.loads(queryset.explain(format="json"))
+        except EmptyResultSet:
+            return 0
+        # Django < 4.2 returns the plan array PostgreSQL sends, later versions
+        # join its elements, leaving the single plan object
+        if isinstance(plan, list):
+            plan = plan[0]
+        return int(plan["Plan"]["Plan Rows"])
+
+
+class CountStrategyPaginator(Paginator[_T]):
+    """A `Paginator` that delegates counting its object_list to a `CountStrategy`.
+
+    With an approximate strategy, page numbers past the counted number of pages
+    are not rejected, as the count may be lower than the real number of objects.
+    """
+
+    def __init__(
+        self,
+        object_list: _SupportsPagination[_T],
+        per_page: int | str,
+        *,
+        count_strategy: CountStrategy | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = (
+            count_strategy if count_strategy is not None else ExactCount()
+        )
+        self._highest_page = 0
+
+    @cached_property
+    @override
+    def count(self) -> int:  # pyright: ignore[reportIncompatibleVariableOverride]
+        return self.count_strategy.count(self.object_list)
+
+    @override
+    def validate_number(self, number: int | float | str) -> int:
+        if not self.count_strategy.approximate:
+            return super().validate_number(number)
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # past the counted pages is fine, before the first page is not
+            if int(number) < 1:
+                raise
+            return int(number)
+
+    @override
+    def page(self, number: int | str) -> Page[_T]:
+        if not self.count_strategy.approximate:
+            return super().page(number)
+        # don't clamp the last page to the count, which may be too low
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        self._highest_page = max(self._highest_page, number)
+        return self._get_page(  # type: ignore[attr-defined]
+            self.object_list[bottom:top], number, self
+        )
+
+    @property
+    @override
+    def num_pages(self) -> int:  # pyright: ignore[reportIncompatibleVariableOverride]
+        num_pages = super().num_pages
+        if self.count_strategy.approximate:
+            # never report fewer pages than have been served
+            return max(num_pages, self._highest_page)
+        return num_pages
+
+
+class CountlessPaginator(Paginator[_T]):
+    """Paginate by page number without ever counting the object_list.
+
+    Each page fetches `per_page + 1` rows, the extra row only tells whether there
+    is a next page. As the total is never known, `num_pages` (and so `page_range`
+    and `get_elided_page_range()`) only covers the pages known to exist so far,
+    i.e. up to the page after the last one fetched if it has a next page.
+    """
+
+    def __init__(
+        self, object_list: _SupportsPagination[_T], per_page: int | str, **kwargs: Any
+    ) -> None:
+        if kwargs.get("orphans"):
+            warnings.warn(
+                "The `orphans` parameter is not applicable for CountlessPaginator and will be ignored.",
+                UserWarning,
+                stacklevel=2,
+            )
+            kwargs["orphans"] = 0
+
+        super().__init__(object_list, per_page, **kwargs)
+        self._known_pages = 0
+
+    @override
+    def validate_number(self, number: int | float | str) -> int:
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError) as exc:
+            raise PageNotAnInteger(self.error_messages["invalid_page"]) from exc
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    @override
+    def page(self, number: int | str) -> CountlessPage[_T]:
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+
+        object_list = list(self.object_list[bottom : top + 1])
+        has_next = len(object_list) > self.per_page
+        object_list = object_list[: self.per_page]
+
+        if not object_list and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages["no_results"])
+
+        self._known_pages = max(self._known_pages, number + 1 if has_next else number)
+        return CountlessPage(object_list, number, self, has_next=has_next)
+
+    @property
+    @override
+    def num_pages(self) -> int:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Return the number of pages known to exist so far."""
+        return self._known_pages
+
+
+class CountlessPage(Page[_T]):
+    def __init__(
+        self,
+        object_list: _SupportsPagination[_T],
+        number: int,
+        paginator: CountlessPaginator[_T],
+        *,
+        has_next: bool,
+    ) -> None:
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    @override
+    def __repr__(self) -> str:
+        return f"<Page {self.number}>"
+
+    @override
+    def has_next(self) -> bool:
+        return self._has_next
+
+    @override
+    def start_index(self) -> int:
+        if not self.object_list:
+            return 0
+        return self.paginator.per_page * (self.number - 1) + 1
+
+    @override
+    def end_index(self) -> int:
+        return self.paginator.per_page * (self.number - 1) + len(self.object_list)
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+class KeysetPaginator(Generic[_M]):
+    """Paginate a QuerySet by seeking past the last row of the previous page.
+
+    Rather than an `OFFSET`, each page filters on the values of the ordering
+    columns of the row it starts after, so every page costs the same (one indexed
+    range query for `per_page + 1` rows) no matter how deep it is, and no `COUNT`
+    is ever run. Pages are addressed by opaque cursors instead of page numbers.
+
+    The ordering is taken from the QuerySet, `pk` is appended to it as a tie
+    breaker if it is not already there, and its columns must not be nullable.
+    """
+
+    def __init__(
+        self,
+        object_list: QuerySet[_M],
+        per_page: int | str,
+        ordering: Sequence[str | Combinable] | None = None,
+    ) -> None:
+        if not isinstance(object_list, QuerySet):
+            raise TypeError("KeysetPaginator only supports QuerySet object_lists.")
+
+        self.per_page = int(per_page)
+        if self.per_page < 1:
+            raise ValueError("`per_page` must be a positive integer.")
+
+        query = object_list.query
+        if ordering is None:
+            ordering = query.order_by or (
+                object_list.model._meta.ordering if query.default_ordering else []
+            )
+        self.ordering = self._get_ordering(ordering or [], object_list.model)
+
+        if not query.standard_ordering:
+            # `QuerySet.reverse()` is kept across `order_by()` calls, so undo it
+            # here now that it is part of `self.ordering`
+            object_list = object_list.reverse()
+            self.ordering = [(name, not ascending) for name, ascending in self.ordering]
+
+        self.object_list = object_list
+
+    def _get_ordering(
+        self, ordering: Sequence[Any], model: type[Model]
+    ) -> list[tuple[str, bool]]:
+        """Normalize `ordering` to `(field, ascending)` pairs ending with `pk`."""
+        keys: list[tuple[str, bool]] = []
+        for entry in ordering:
+            if isinstance(entry, str) and entry != "?":
+                keys.append((entry.lstrip("-"), not entry.startswith("-")))
+            elif isinstance(entry, OrderBy) and isinstance(entry.expression, F):
+                keys.append((entry.expression.name, not entry.descending))  # type: ignore[attr-defined]
+            else:
+                raise ValueError(
+                    f"KeysetPaginator cannot seek on the ordering {entry!r}, only field "
+                    "names and `F()` expressions are supported."
+                )
+
+        # the ordering has to be unique for seeking to be exact, so break any ties
+        # on the primary key
+        if not keys or keys[-1][0] not in {"pk", model._meta.pk.name}:
+            keys.append(("pk", keys[-1][1] if keys else True))
+        return keys
+
+    @cached_property
+    def _keyed_object_list(self) -> QuerySet[_M]:
+        # annotate the ordering columns so their values can be read back off any
+        # row, model instance or dict, and filtered on with the same names
+        return self.object_list.annotate(
+            **{
+                self._key_name(index): F(name)
+                for index, (name, _) in enumerate(self.ordering)
+            }
+        )
+
+    @staticmethod
+    def _key_name(index: int) -> str:
+        return f"keyset_paginator_{index}"
+
+    def get_keys(self, row: Any) -> list[Any]:
+        """Return the values of the ordering columns of `row`."""
+        if isinstance(row, Mapping):
+            return [row[self._key_name(index)] for index in range(len(self.ordering))]
+        return [
+            getattr(row, self._key_name(index)) for index in range(len(self.ordering))
+        ]
+
+    def encode_cursor(self, keys: Sequence[Any], *, previous: bool = False) -> str:
+        payload = {
+            "p": previous,
+            "k": [
+                value.isoformat()
+                if isinstance(value, datetime.date | datetime.time)
+                else str(value)
+                if isinstance(value, Decimal | UUID)
+                else value
+                for value in keys
+            ],
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+    def decode_cursor(self, cursor: str) -> tuple[list[Any], bool]:
+        try:
+            data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(data)
+            keys, previous = payload["k"], payload["p"]
+        except (ValueError, TypeError, KeyError) as exc:
+            raise InvalidCursor("That cursor is not valid") from exc
+        if not isinstance(keys, list) or len(keys) != len(self.ordering):
+            raise InvalidCursor("That cursor is not valid")
+        return keys, bool(previous)
+
+    def page(self, cursor: str | None = None) -> KeysetPage[_M]:
+        """Return the page after (or, for a previous cursor, before) `cursor`."""
+        keys: list[Any] | None = None
+        previous = False
+        if cursor:
+            keys, previous = self.decode_cursor(cursor)
+
+        object_list = self._keyed_object_list
+        if keys is not None:
+            object_list = object_list.filter(self._seek(keys, previous=previous))
+
+        ordering = [
+            f"{'' if ascending is not previous else '-'}{self._key_name(index)}"
+            for index, (_, ascending) in enumerate(self.ordering)
+        ]
+        rows = list(object_list.order_by(*ordering)[: self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+
+        if previous:
+            # previous pages are fetched walking backwards from the cursor
+            rows.reverse()
+            return KeysetPage(rows, self, has_next=True, has_previous=has_more)
+        return KeysetPage(rows, self, has_next=has_more, has_previous=keys is not None)
+
+    def _seek(self, keys: Sequence[Any], *, previous: bool) -> Q:
+        """Build the filter for the rows after (or before) the row with `keys`.
+
+        For an ordering of `(a, b, pk)` this is `a > x OR (a = x AND b > y) OR
+        (a = x AND b = y AND pk > z)`, with each comparison flipped for
+        descending columns and again when seeking backwards.
+        """
+        seek = Q()
+        for index, (_, ascending) in enumerate(self.ordering):
+            lookup = "gt" if ascending is not previous else "lt"
+            condition = Q(**{f"{self._key_name(index)}__{lookup}": keys[index]})
+            for equal_index in range(index):
+                condition &= Q(**{self._key_name(equal_index): keys[equal_index]})
+            seek |= condition
+        return seek
+
+
+class KeysetPage(Sequence[_M]):
+    def __init__(
+        self,
+        object_list: list[_M],
+        paginator: KeysetPaginator[_M],
+        *,
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    @override
+    def __repr__(self) -> str:
+        return f"<KeysetPage of {len(self.object_list)} objects>"
+
+    @override
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    @overload
+    def __getitem__(self, index: int) -> _M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_M]: ...
+
+    @override
+    def __getitem__(self, index: int | slice) -> _M | list[_M]:
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    @cached_property
+    def next_cursor(self) -> str | None:
+        if not self._has_next or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator.get_keys(self.object_list[-1])
+        )
+
+    @cached_property
+    def previous_cursor(self) -> str | None:
+        if not self._has_previous or not self.object_list:
+            return None
+        return self.paginator.encode_cursor(
+            self.paginator.get_keys(self.object_list[0]), previous=True
+        )
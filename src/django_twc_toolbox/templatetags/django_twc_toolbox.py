@@ -12,6 +12,8 @@ from django.core.paginator import Paginator
 from django.db import models
 
 from django_twc_toolbox.numbers import format_number_no_round
+from django_twc_toolbox.paginator import DatePageLink
+from django_twc_toolbox.paginator import DatePaginator
 
 register = template.Library()
 
@@ -55,6 +57,18 @@ def elided_page_range(page_obj: Page[_TModel]) -> Iterable[str | int]:
     return paginator.get_elided_page_range(page_obj.number)
 
 
+@register.simple_tag()
+def elided_date_page_range(
+    page_obj: Page[_TModel], on_each_side: int = 3, on_ends: int = 2
+) -> Iterable[str | DatePageLink]:
+    paginator: DatePaginator[_TModel] | None = getattr(page_obj, "paginator", None)
+    if not paginator:
+        return []
+    return paginator.get_elided_date_range(
+        page_obj.number, on_each_side=on_each_side, on_ends=on_ends
+    )
+
+
 # Coming in the next Django version
 # Copied from https://github.com/django/django/pull/17368
 # TODO: Remove this when Django 5.1 is released
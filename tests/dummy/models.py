@@ -13,6 +13,15 @@ class DateTimeOrderableModel(models.Model):
     date = models.DateTimeField()
 
 
+class NullableDateOrderableModel(models.Model):
+    date = models.DateField(null=True)
+
+
+class GroupedDateOrderableModel(models.Model):
+    group = models.IntegerField(null=True)
+    date = models.DateField()
+
+
 class ModelWithHistory(WithHistory):
     name = models.CharField(max_length=255)
 
@@ -3,8 +3,24 @@ from __future__ import annotations
 from django.db import models
 
 
+class Folder(models.Model):
+    name = models.CharField(max_length=255)
+
+    def __str__(self):
+        return self.name
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=255)
+
+    def __str__(self):
+        return self.name
+
+
 class Bookmark(models.Model):
     url = models.URLField(unique=True)
     title = models.CharField(max_length=255)
     note = models.TextField(blank=True)
     favourite = models.BooleanField(default=False)
+    folder = models.ForeignKey(Folder, blank=True, null=True, on_delete=models.SET_NULL)
+    tags = models.ManyToManyField(Tag, blank=True)
@@ -3,13 +3,28 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 import pytest
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import Paginator
+from django.http import Http404
 from django.http import QueryDict
+from django_filters import CharFilter
+from django_filters import FilterSet
+from django_tables2 import tables
 from django_tables2.views import SingleTableMixin
 from model_bakery import baker
 from neapolitan.views import Role
 
 from .models import Bookmark
+from .models import Folder
+from .models import Tag
+from .views import BookmarkCachedCountTableView
+from .views import BookmarkCachedCountView
+from .views import BookmarkCountlessView
+from .views import BookmarkFolderView
+from .views import BookmarkKeysetView
+from .views import BookmarkTable
+from .views import BookmarkTableOrdered
 from .views import BookmarkTableOrderedView
 from .views import BookmarkTableView
 from .views import BookmarkView
@@ -334,6 +349,99 @@ def test_filterset_extra_methods_no_filters(rf):
     assert filterset.active_filters == {}
 
 
+def test_filterset_class_cached(rf):
+    class BookmarkFilterSet(FilterSet):
+        class Meta:
+            model = Bookmark
+            fields = ["url", "title", "note"]
+
+    class BookmarkFilterSetClassView(BookmarkView):
+        filterset_class = BookmarkFilterSet
+        filterset_primary_fields = ["url"]
+
+    request = rf.get(Role.LIST.maybe_reverse(BookmarkView))
+
+    filtersets = []
+    for _ in range(2):
+        view = BookmarkFilterSetClassView(
+            role=Role.LIST, **Role.LIST.extra_initkwargs()
+        )
+        view.setup(request)
+        filtersets.append(view.get_filterset())
+
+    assert filtersets[0].__class__ is filtersets[1].__class__
+    assert issubclass(filtersets[0].__class__, BookmarkFilterSet)
+    assert filtersets[0].secondary_fields == ["title", "note"]
+    assert not hasattr(BookmarkFilterSet, "is_active")
+    assert not hasattr(BookmarkFilterSet, "primary_fields")
+
+
+def test_filterset_class_primary_fields_kept(rf):
+    class BookmarkFilterSet(FilterSet):
+        primary_fields = ["title"]
+
+        class Meta:
+            model = Bookmark
+            fields = ["url", "title", "note"]
+
+    class BookmarkFilterSetClassView(BookmarkView):
+        filterset_class = BookmarkFilterSet
+
+    request = rf.get(Role.LIST.maybe_reverse(BookmarkView))
+
+    view = BookmarkFilterSetClassView(role=Role.LIST, **Role.LIST.extra_initkwargs())
+    view.setup(request)
+
+    filterset = view.get_filterset()
+
+    assert filterset.primary_fields == ["title"]
+
+
+def test_filterset_secondary_fields_init_filters(rf):
+    class BookmarkFilterSet(FilterSet):
+        class Meta:
+            model = Bookmark
+            fields = ["url", "title"]
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.filters["note"] = CharFilter(field_name="note")
+
+    class BookmarkFilterSetClassView(BookmarkView):
+        filterset_class = BookmarkFilterSet
+        filterset_primary_fields = ["url"]
+
+    request = rf.get(Role.LIST.maybe_reverse(BookmarkView))
+
+    view = BookmarkFilterSetClassView(role=Role.LIST, **Role.LIST.extra_initkwargs())
+    view.setup(request)
+
+    filterset = view.get_filterset()
+
+    assert filterset.secondary_fields == ["title", "note"]
+
+
+def test_filterset_active_filters_cached(rf):
+    class BookmarkFilterSetActiveFiltersView(BookmarkView):
+        filterset_fields = ["url", "title", "note"]
+
+    request = rf.get(
+        Role.LIST.maybe_reverse(BookmarkView), data=QueryDict("url=example.com")
+    )
+
+    view = BookmarkFilterSetActiveFiltersView(
+        role=Role.LIST, **Role.LIST.extra_initkwargs()
+    )
+    view.setup(request)
+
+    filterset = view.get_filterset()
+
+    filterset.form.is_valid()
+
+    assert filterset.active_filters is filterset.active_filters
+    assert filterset.is_active() is True
+
+
 @pytest.mark.parametrize(
     "role",
     [
@@ -497,3 +605,413 @@ def test_list_pagination(klass, quantity, paginate_by, expected, rf, db):
     object_list = rendered.context_data["object_list"]
 
     assert len(object_list) == expected
+
+
+def test_list_table_pagination(client, db, django_assert_num_queries):
+    baker.make(Bookmark, _quantity=3)
+
+    with django_assert_num_queries(2) as captured:
+        response = client.get(
+            Role.LIST.maybe_reverse(BookmarkTableOrderedView), {"page": 2}
+        )
+
+    assert response.status_code == 200
+    count_sql, rows_sql = (query["sql"] for query in captured.captured_queries)
+    assert "COUNT" in count_sql
+    assert "LIMIT 1 OFFSET 1" in rows_sql
+    page_obj = response.context["page_obj"]
+    assert page_obj is response.context["table"].page
+    assert page_obj.number == 2
+    assert len(page_obj.object_list) == 1
+
+
+def test_list_table_pagination_invalid_page(client, db):
+    baker.make(Bookmark, _quantity=3)
+
+    response = client.get(Role.LIST.maybe_reverse(BookmarkTableView), {"page": 99})
+
+    assert response.status_code == 404
+
+
+def test_list_keyset_pagination(client, db):
+    for title in "abcde":
+        baker.make(Bookmark, title=title)
+    url = Role.LIST.maybe_reverse(BookmarkKeysetView)
+
+    titles = []
+    response = client.get(url)
+    while True:
+        page = response.context["page_obj"]
+        titles.extend(bookmark.title for bookmark in page)
+        if not page.has_next():
+            break
+        assert f"?cursor={page.next_cursor}" in response.content.decode()
+        response = client.get(url, {"cursor": page.next_cursor})
+
+    assert titles == list("abcde")
+    assert response.context["is_paginated"] is True
+    assert f"?cursor={page.previous_cursor}" in response.content.decode()
+
+
+def test_list_keyset_pagination_invalid_cursor(client, db):
+    response = client.get(
+        Role.LIST.maybe_reverse(BookmarkKeysetView), {"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 404
+
+
+def test_list_keyset_pagination_table_class():
+    class BookmarkKeysetTableView(BookmarkKeysetView):
+        table_class = BookmarkTable
+
+    with pytest.raises(ImproperlyConfigured):
+        BookmarkKeysetTableView.as_view(role=Role.LIST)
+
+
+@pytest.mark.parametrize(
+    "page,expected_titles,expected_has_next",
+    [
+        (1, ["a", "b"], True),
+        (2, ["c", "d"], True),
+        (3, ["e"], False),
+    ],
+)
+def test_list_countless_pagination(
+    page, expected_titles, expected_has_next, rf, db, django_assert_num_queries
+):
+    for title in "abcde":
+        baker.make(Bookmark, title=title)
+    request = rf.get(Role.LIST.maybe_reverse(BookmarkCountlessView), {"page": page})
+
+    view = BookmarkCountlessView(
+        paginate_by=2, role=Role.LIST, **Role.LIST.extra_initkwargs()
+    )
+    view.setup(request)
+
+    with django_assert_num_queries(1) as captured:
+        rendered = view.list(request=request)
+
+    assert "COUNT" not in captured.captured_queries[0]["sql"]
+    page_obj = rendered.context_data["page_obj"]
+    assert [bookmark.title for bookmark in page_obj] == expected_titles
+    assert page_obj.has_next() is expected_has_next
+    assert rendered.context_data["is_paginated"] is True
+
+
+def test_list_cached_count_pagination(rf, db, settings, django_assert_num_queries):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    for title in "abcde":
+        baker.make(Bookmark, title=title)
+
+    def render(page):
+        request = rf.get(
+            Role.LIST.maybe_reverse(BookmarkCachedCountView), {"page": page}
+        )
+        view = BookmarkCachedCountView(
+            paginate_by=2, role=Role.LIST, **Role.LIST.extra_initkwargs()
+        )
+        view.setup(request)
+        return view.list(request=request)
+
+    try:
+        render(1)
+
+        with django_assert_num_queries(1) as captured:
+            rendered = render(3)
+            page_obj = rendered.context_data["page_obj"]
+            assert len(page_obj) == 1
+            assert list(page_obj.paginator.get_elided_page_range(page_obj.number)) == [
+                1,
+                2,
+                3,
+            ]
+
+        assert "COUNT" not in captured.captured_queries[0]["sql"]
+        assert page_obj[0] == Bookmark.objects.get(title="e")
+    finally:
+        caches["default"].clear()
+
+
+def test_list_cached_count_table_pagination(
+    client, db, settings, django_assert_num_queries
+):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    for title in "abcde":
+        baker.make(Bookmark, title=title)
+    url = Role.LIST.maybe_reverse(BookmarkCachedCountTableView)
+
+    try:
+        client.get(url)
+
+        with django_assert_num_queries(1) as captured:
+            response = client.get(url, {"page": 3})
+
+        assert "COUNT" not in captured.captured_queries[0]["sql"]
+        assert response.context["page_obj"].paginator.count == 5
+        assert len(response.context["page_obj"].object_list) == 1
+    finally:
+        caches["default"].clear()
+
+
+def test_count_strategy_requires_count_strategy_paginator(rf):
+    class BookmarkCountStrategyView(BookmarkCachedCountView):
+        paginator_class = Paginator
+
+    view = BookmarkCountStrategyView(role=Role.LIST)
+
+    with pytest.raises(ImproperlyConfigured):
+        view.get_paginator(Bookmark.objects.none(), 2)
+
+
+@pytest.mark.parametrize(
+    "role,expected",
+    [
+        (Role.LIST, (["folder"], ["tags"])),
+        (Role.DETAIL, (["folder"], [])),
+        (Role.CREATE, ([], [])),
+        (Role.UPDATE, ([], [])),
+        (Role.DELETE, ([], [])),
+    ],
+)
+def test_get_related_lookups(role, expected):
+    view = BookmarkFolderView(role=role)
+
+    assert view.get_related_lookups() == expected
+
+
+def test_get_related_lookups_non_relation_fields():
+    view = BookmarkView(role=Role.LIST)
+
+    assert view.get_related_lookups() == ([], [])
+
+
+def test_get_related_lookups_opt_out():
+    class BookmarkFolderNoRelatedView(BookmarkFolderView):
+        auto_related = False
+
+    view = BookmarkFolderNoRelatedView(role=Role.LIST)
+
+    assert view.get_related_lookups() == ([], [])
+
+
+def test_get_related_lookups_extra_paths():
+    class BookmarkFolderExtraView(BookmarkFolderView):
+        select_related = ["folder"]
+        prefetch_related = ["tags", "folder__bookmark_set"]
+
+    view = BookmarkFolderExtraView(role=Role.LIST)
+
+    assert view.get_related_lookups() == (
+        ["folder"],
+        ["tags", "folder__bookmark_set"],
+    )
+
+
+def test_list_related_fields_num_queries(rf, db, django_assert_num_queries):
+    tag = baker.make(Tag)
+    for title in "abcde":
+        baker.make(Bookmark, title=title, folder=baker.make(Folder), tags=[tag])
+    request = rf.get(Role.LIST.maybe_reverse(BookmarkFolderView))
+
+    view = BookmarkFolderView(role=Role.LIST, **Role.LIST.extra_initkwargs())
+    view.setup(request)
+
+    # count, rows with their folders, and the tags of the page
+    with django_assert_num_queries(3):
+        rendered = view.list(request=request)
+        rendered.render()
+
+
+def test_detail_related_fields_num_queries(rf, db, django_assert_num_queries):
+    bookmark = baker.make(Bookmark, folder=baker.make(Folder))
+    request = rf.get(Role.DETAIL.maybe_reverse(BookmarkFolderView, bookmark))
+
+    view = BookmarkFolderView(role=Role.DETAIL, **Role.DETAIL.extra_initkwargs())
+    view.setup(request, pk=bookmark.pk)
+
+    with django_assert_num_queries(1):
+        rendered = view.detail(request=request, pk=bookmark.pk)
+        rendered.render()
+
+    assert str(bookmark.folder) in rendered.content.decode()
+
+
+@pytest.mark.parametrize(
+    "klass,role,expected",
+    [
+        (BookmarkView, Role.LIST, ["id", "url"]),
+        (BookmarkFolderView, Role.LIST, ["id", "url", "folder"]),
+        (BookmarkView, Role.DETAIL, None),
+        (BookmarkView, Role.UPDATE, None),
+    ],
+)
+def test_get_list_only_fields(klass, role, expected):
+    view = klass(role=role)
+
+    assert view.get_list_only_fields() == expected
+
+
+def test_get_list_only_fields_lookup_field_and_select_related():
+    class BookmarkLookupView(BookmarkView):
+        lookup_field = "title"
+        select_related = ["folder"]
+
+    view = BookmarkLookupView(role=Role.LIST)
+
+    assert view.get_list_only_fields() == ["id", "title", "url", "folder"]
+
+
+def test_get_list_only_fields_non_model_field():
+    class BookmarkPropertyView(BookmarkView):
+        list_fields = ["url", "domain"]
+
+    view = BookmarkPropertyView(role=Role.LIST)
+
+    assert view.get_list_only_fields() is None
+
+
+def test_get_list_only_fields_opt_out():
+    class BookmarkAllColumnsView(BookmarkView):
+        list_only = False
+
+    view = BookmarkAllColumnsView(role=Role.LIST)
+
+    assert view.get_list_only_fields() is None
+
+
+def test_get_list_only_fields_table_class():
+    class BookmarkFolderTable(tables.Table):
+        folder_name = tables.Column(accessor="folder__name")
+
+        class Meta:
+            model = Bookmark
+            fields = ["title"]
+
+    class BookmarkFolderTableView(BookmarkView):
+        table_class = BookmarkFolderTable
+
+    View = BookmarkFolderTableView.as_view(role=Role.LIST).view_class
+    view = View(role=Role.LIST, table_class=BookmarkFolderTable)
+
+    assert view.get_list_only_fields() == ["id", "title", "folder"]
+
+
+def test_list_only_fields_query(rf, db, django_assert_num_queries):
+    baker.make(Bookmark, _quantity=3)
+    request = rf.get(Role.LIST.maybe_reverse(BookmarkView))
+
+    view = BookmarkView(role=Role.LIST, **Role.LIST.extra_initkwargs())
+    view.setup(request)
+
+    with django_assert_num_queries(2) as captured:
+        rendered = view.list(request=request)
+        rendered.render()
+
+    sql = captured.captured_queries[-1]["sql"]
+    assert '"url"' in sql
+    assert '"note"' not in sql
+
+
+def test_list_only_fields_queryset_only(rf, db):
+    class BookmarkOnlyView(BookmarkView):
+        queryset = Bookmark.objects.only("id", "url", "title")
+
+    view = BookmarkOnlyView(role=Role.LIST)
+
+    assert view.get_queryset().query.deferred_loading == (
+        frozenset({"id", "url", "title"}),
+        False,
+    )
+
+
+def test_as_view_table_class_cached():
+    view = BookmarkTableView.as_view(role=Role.LIST)
+    other_view = BookmarkTableView.as_view(role=Role.LIST)
+
+    assert view.view_class is other_view.view_class
+    assert view.view_class is BookmarkTableView.get_list_view_with_table()
+
+
+def test_as_view_table_class_cached_per_table_class():
+    class BookmarkOtherTableView(BookmarkTableView):
+        table_class = BookmarkTableOrdered
+
+    assert (
+        BookmarkOtherTableView.get_list_view_with_table()
+        is not BookmarkTableView.get_list_view_with_table()
+    )
+
+
+def test_get_list_view_with_table_no_table_class():
+    with pytest.raises(ImproperlyConfigured):
+        BookmarkView.get_list_view_with_table()
+
+
+@pytest.mark.parametrize(
+    "klass,paginate_by,num_queries",
+    [
+        # the count
+        (BookmarkView, 2, 1),
+        (BookmarkTableView, 2, 1),
+        # the first page, there's no count
+        (BookmarkCountlessView, 2, 1),
+        (BookmarkKeysetView, 2, 1),
+        # the whole list
+        (BookmarkView, None, 1),
+    ],
+)
+def test_list_not_allow_empty(
+    klass, paginate_by, num_queries, rf, db, django_assert_num_queries
+):
+    View = klass.as_view(role=Role.LIST).view_class
+    request = rf.get(Role.LIST.maybe_reverse(View))
+
+    view = View(
+        allow_empty=False,
+        paginate_by=paginate_by,
+        role=Role.LIST,
+        table_class=klass.table_class,
+        **Role.LIST.extra_initkwargs(),
+    )
+    view.setup(request)
+
+    with django_assert_num_queries(num_queries), pytest.raises(Http404):
+        view.list(request=request)
+
+
+@pytest.mark.parametrize(
+    "klass,paginate_by,num_queries",
+    [
+        # the count and the page
+        (BookmarkView, 2, 2),
+        # the page
+        (BookmarkCountlessView, 2, 1),
+        # the whole list
+        (BookmarkView, None, 1),
+    ],
+)
+def test_list_not_allow_empty_with_objects(
+    klass, paginate_by, num_queries, rf, db, django_assert_num_queries
+):
+    for title in "abc":
+        baker.make(Bookmark, title=title)
+    request = rf.get(Role.LIST.maybe_reverse(klass))
+
+    view = klass(
+        allow_empty=False,
+        paginate_by=paginate_by,
+        role=Role.LIST,
+        **Role.LIST.extra_initkwargs(),
+    )
+    view.setup(request)
+
+    with django_assert_num_queries(num_queries):
+        rendered = view.list(request=request)
+        rendered.render()
+
+    assert rendered.status_code == 200
@@ -3,6 +3,9 @@ from __future__ import annotations
 from django_tables2 import tables
 
 from django_twc_toolbox.crud.views import CRUDView
+from django_twc_toolbox.paginator import CachedCount
+from django_twc_toolbox.paginator import CountlessPaginator
+from django_twc_toolbox.paginator import KeysetPaginator
 
 from .models import Bookmark
 
@@ -37,8 +40,45 @@ class BookmarkTableOrderedView(BookmarkView):
     url_base = "bookmarktableordered"
 
 
+class BookmarkKeysetView(BookmarkView):
+    paginator_class = KeysetPaginator
+    paginate_by = 2
+    url_base = "bookmarkkeyset"
+    queryset = Bookmark.objects.order_by("title")
+
+
+class BookmarkCountlessView(BookmarkView):
+    paginator_class = CountlessPaginator
+    url_base = "bookmarkcountless"
+    queryset = Bookmark.objects.order_by("title")
+
+
+class BookmarkCachedCountView(BookmarkView):
+    count_strategy = CachedCount()
+    url_base = "bookmarkcachedcount"
+    queryset = Bookmark.objects.order_by("title")
+
+
+class BookmarkCachedCountTableView(BookmarkCachedCountView):
+    table_class = BookmarkTable
+    paginate_by = 2
+    url_base = "bookmarkcachedcounttable"
+
+
+class BookmarkFolderView(BookmarkView):
+    detail_fields = ["title", "folder"]
+    list_fields = ["url", "folder", "tags"]
+    url_base = "bookmarkfolder"
+    queryset = Bookmark.objects.order_by("title")
+
+
 urlpatterns = [
     *BookmarkView.get_urls(),
     *BookmarkTableView.get_urls(),
     *BookmarkTableOrderedView.get_urls(),
+    *BookmarkKeysetView.get_urls(),
+    *BookmarkCountlessView.get_urls(),
+    *BookmarkCachedCountView.get_urls(),
+    *BookmarkCachedCountTableView.get_urls(),
+    *BookmarkFolderView.get_urls(),
 ]
@@ -5,21 +5,44 @@ import itertools
 import random
 from dataclasses import asdict
 from dataclasses import dataclass
+from operator import itemgetter
 
 import pytest
+from asgiref.sync import async_to_sync
 from django import VERSION as DJANGO_VERSION
+from django.core.cache import caches
 from django.core.paginator import EmptyPage
 from django.core.paginator import Page
 from django.core.paginator import PageNotAnInteger
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import Max
+from django.db.models import Sum
 from django.db.models.query import QuerySet
+from django.template import Context
+from django.template import Template
 from django.utils import timezone
 from model_bakery import baker
 
+from django_twc_toolbox.paginator import CachedCount
+from django_twc_toolbox.paginator import CountlessPaginator
+from django_twc_toolbox.paginator import CountStrategyPaginator
 from django_twc_toolbox.paginator import DatePage
+from django_twc_toolbox.paginator import DatePageLink
 from django_twc_toolbox.paginator import DatePaginator
+from django_twc_toolbox.paginator import EstimatedCount
+from django_twc_toolbox.paginator import ExactCount
+from django_twc_toolbox.paginator import GroupedDatePaginator
+from django_twc_toolbox.paginator import InvalidCursor
+from django_twc_toolbox.paginator import KeysetPaginator
+from django_twc_toolbox.paginator import StreamingDatePaginator
 
 from .dummy.models import DateOrderableModel
 from .dummy.models import DateTimeOrderableModel
+from .dummy.models import GroupedDateOrderableModel
+from .dummy.models import NullableDateOrderableModel
 
 
 @dataclass
@@ -321,6 +344,142 @@ class TestDatePaginator:
             assert item.date <= previous_item
             previous_item = item.date
 
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_bounds_single_query(
+        self, model_data_queryset, order_by, django_assert_num_queries
+    ):
+        paginator = DatePaginator(
+            model_data_queryset.order_by(order_by), "date", datetime.timedelta(days=30)
+        )
+
+        with django_assert_num_queries(1):
+            assert paginator.num_pages == 3
+            assert paginator.count == 90
+            assert paginator.chronological is (order_by == "date")
+            assert len(paginator.date_segments) == 3
+
+    @pytest.mark.parametrize("grouped", [False, True])
+    def test_count_distinct_or_grouped(self, db, grouped):
+        for day in (1, 2, 3):
+            baker.make(
+                DateOrderableModel, date=datetime.date(2024, 1, day), _quantity=2
+            )
+        if grouped:
+            objects = DateOrderableModel.objects.values("date").annotate(n=Count("id"))
+        else:
+            objects = DateOrderableModel.objects.values_list(
+                "date", flat=True
+            ).distinct()
+        objects = objects.order_by("date")
+
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=7))
+
+        assert paginator.count == objects.count() == 3
+        assert len(paginator.page(1).object_list) == 3
+
+    @pytest.mark.parametrize("days_per_page", [1, 7, 30, 89, 90, 365])
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_date_segments_lazy(self, days_per_page, reverse):
+        page_date_range = datetime.timedelta(days=days_per_page)
+        dates = [
+            datetime.date(2024, 1, 1) + datetime.timedelta(days=i) for i in range(90)
+        ]
+        if reverse:
+            dates.reverse()
+        objects = [DateOrderableModel(date=date) for date in dates]
+
+        # the segments as they would be built by stepping through the date range
+        expected = []
+        step = -page_date_range if reverse else page_date_range
+        start_date, end_date = dates[0], dates[0] + step
+        while (end_date >= dates[-1]) if reverse else (end_date <= dates[-1]):
+            expected.append((start_date, end_date))
+            start_date, end_date = end_date, end_date + step
+        one_day = datetime.timedelta(days=-1 if reverse else 1)
+        expected.append((start_date, dates[-1] + one_day))
+
+        paginator = DatePaginator(objects, "date", page_date_range)
+
+        assert not isinstance(paginator.date_segments, list)
+        assert len(paginator.date_segments) == len(expected)
+        assert list(paginator.date_segments) == expected
+        assert paginator.date_segments[-1] == expected[-1]
+        assert paginator.date_segments[1:3] == expected[1:3]
+        with pytest.raises(IndexError):
+            paginator.date_segments[len(expected)]
+
+    @pytest.mark.parametrize(
+        "model_data_queryset",
+        [
+            ModelClassParams(model_class=DateOrderableModel, number_of_days=90),
+            ModelClassParams(model_class=DateTimeOrderableModel, number_of_days=90),
+        ],
+        indirect=["model_data_queryset"],
+    )
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_list_pages_match_scan(self, model_data_queryset, reverse):
+        objects = list(model_data_queryset)
+        if reverse:
+            objects.reverse()
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=7))
+
+        for page in paginator:
+            if reverse:
+                expected = [
+                    obj
+                    for obj in objects
+                    if page.start_date >= obj.date > page.end_date
+                ]
+            else:
+                expected = [
+                    obj
+                    for obj in objects
+                    if page.start_date <= obj.date < page.end_date
+                ]
+            assert page.object_list == expected
+
+    @pytest.mark.parametrize(
+        "ordering,expected",
+        [
+            (lambda qs: qs.order_by("date"), True),
+            (lambda qs: qs.order_by("-date"), False),
+            (lambda qs: qs.order_by("date").reverse(), False),
+            (lambda qs: qs.order_by("-date").reverse(), True),
+            (lambda qs: qs.order_by(F("date").asc()), True),
+            (lambda qs: qs.order_by(F("date").desc()), False),
+            (lambda qs: qs.order_by("-date", "id"), False),
+        ],
+    )
+    def test_chronological_from_ordering(
+        self, model_data_queryset, ordering, expected, django_assert_num_queries
+    ):
+        paginator = DatePaginator(
+            ordering(model_data_queryset), "date", datetime.timedelta(days=30)
+        )
+
+        with django_assert_num_queries(0):
+            assert paginator.chronological is expected
+
+        with django_assert_num_queries(1) as captured:
+            first_page = paginator.page(1)
+        # the bounds query does not need the first row to work out the direction
+        assert "LIMIT" not in captured.captured_queries[0]["sql"]
+
+        dates = [obj.date for obj in first_page.object_list]
+        assert dates == sorted(dates, reverse=not expected)
+
+    def test_chronological_ambiguous_ordering(
+        self, model_data_queryset, django_assert_num_queries
+    ):
+        paginator = DatePaginator(
+            model_data_queryset.order_by("-date", "date"),
+            "date",
+            datetime.timedelta(days=30),
+        )
+
+        with django_assert_num_queries(1):
+            assert paginator.chronological is False
+
     def test_paginator_page_function(self, objects):
         paginator = DatePaginator(objects, "date", datetime.timedelta(days=10))
 
@@ -365,6 +524,303 @@ class TestDatePaginator:
             DatePaginator(objects, "date")
 
 
+class TestDatePaginatorTargetPerPage:
+    @pytest.fixture
+    def skewed_queryset(self, db):
+        start = datetime.date(2024, 1, 1)
+        dates = []
+        for day in range(60):
+            # month end is busy, weekends are empty and everything else is quiet
+            date = start + datetime.timedelta(days=day)
+            if date.weekday() >= 5:
+                continue
+            dates.extend([date] * (40 if date.day >= 28 else 2))
+        baker.make(DateOrderableModel, date=iter(dates), _quantity=len(dates))
+        return DateOrderableModel.objects.all()
+
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_pages_hold_target_rows(self, skewed_queryset, order_by):
+        objects = skewed_queryset.order_by(order_by)
+        paginator = DatePaginator(objects, "date", None, target_per_page=10)
+
+        pages = list(paginator)
+        sizes = [len(page.object_list) for page in pages]
+
+        assert sum(sizes) == objects.count()
+        assert all(size >= 10 for size in sizes[:-1])
+        # a page only runs past the target to finish the rows of its last date
+        assert all(size < 10 + 40 for size in sizes)
+        for page in pages:
+            assert (page.start_date, page.end_date) == paginator.date_segments[
+                page.number - 1
+            ]
+            assert all(
+                page.min_date <= obj.date <= page.max_date for obj in page.object_list
+            )
+
+    def test_list(self, skewed_queryset):
+        objects = list(skewed_queryset.order_by("date"))
+        paginator = DatePaginator(objects, "date", None, target_per_page=10)
+
+        assert sum(len(page.object_list) for page in paginator) == len(objects)
+
+    def test_single_pass(self, skewed_queryset, django_assert_num_queries):
+        count = skewed_queryset.count()
+        paginator = DatePaginator(
+            skewed_queryset.order_by("date"), "date", None, target_per_page=10
+        )
+
+        with django_assert_num_queries(1):
+            assert paginator.num_pages == len(paginator.date_segments)
+            assert paginator.count == count
+            assert paginator.chronological is True
+
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_single_date(self, db, order_by):
+        date = datetime.date(2024, 1, 1)
+        baker.make(DateOrderableModel, date=date, _quantity=5)
+        objects = DateOrderableModel.objects.order_by(order_by)
+
+        paginator = DatePaginator(objects, "date", None, target_per_page=10)
+        apaginator = DatePaginator(objects, "date", None, target_per_page=10)
+
+        assert paginator.num_pages == 1
+        assert paginator.chronological is (order_by == "date")
+        assert len(paginator.page(1).object_list) == 5
+        assert len(async_to_sync(apaginator.apage)(1).object_list) == 5
+
+    def test_empty(self, db):
+        paginator = DatePaginator(
+            DateOrderableModel.objects.none().order_by("date"),
+            "date",
+            None,
+            target_per_page=10,
+        )
+
+        assert paginator.num_pages == 0
+        assert paginator.count == 0
+
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_null_dates(self, db, order_by):
+        for day in range(1, 6):
+            baker.make(NullableDateOrderableModel, date=datetime.date(2024, 1, day))
+        baker.make(NullableDateOrderableModel, date=None, _quantity=2)
+        objects = NullableDateOrderableModel.objects.order_by(order_by)
+
+        paginator = DatePaginator(objects, "date", None, target_per_page=2)
+        apaginator = DatePaginator(objects, "date", None, target_per_page=2)
+
+        assert [len(page.object_list) for page in paginator] == [2, 2, 1]
+        assert list(async_to_sync(apaginator.adate_segments)()) == list(
+            paginator.date_segments
+        )
+        assert paginator.chronological is (order_by == "date")
+
+    def test_requires_range_or_target(self, model_data_queryset):
+        with pytest.raises(ValueError):
+            DatePaginator(model_data_queryset, "date", None)
+
+    def test_target_must_be_positive(self, model_data_queryset):
+        with pytest.raises(ValueError):
+            DatePaginator(model_data_queryset, "date", None, target_per_page=0)
+
+
+class TestDatePaginatorSkipEmpty:
+    @pytest.fixture(params=[DateOrderableModel, DateTimeOrderableModel])
+    def bursty_queryset(self, request, db):
+        model_class = request.param
+        start = datetime.date(2024, 1, 1)
+        dates = []
+        # a handful of bursts with long quiet stretches in between
+        for offset in (0, 1, 45, 46, 47, 120, 300):
+            date = start + datetime.timedelta(days=offset)
+            if model_class is DateTimeOrderableModel:
+                date = timezone.make_aware(
+                    datetime.datetime.combine(date, datetime.time(0))
+                )
+            dates.extend([date] * 3)
+        baker.make(model_class, date=iter(dates), _quantity=len(dates))
+        return model_class.objects.all()
+
+    @pytest.mark.parametrize(
+        "kind,expected_num_pages", [("day", 7), ("week", 4), ("month", 4)]
+    )
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    @pytest.mark.parametrize("as_list", [False, True])
+    def test_pages_are_never_empty(
+        self, bursty_queryset, kind, expected_num_pages, order_by, as_list
+    ):
+        objects = bursty_queryset.order_by(order_by)
+        if as_list:
+            objects = list(objects)
+        paginator = DatePaginator(objects, "date", None, skip_empty=kind)
+
+        assert paginator.num_pages == expected_num_pages
+
+        page = paginator.page(1)
+        seen = len(page.object_list)
+        while page.has_next():
+            page = paginator.page(page.next_page_number())
+            assert len(page.object_list) > 0
+            seen += len(page.object_list)
+
+        assert seen == len(objects)
+
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_page_dates(self, bursty_queryset, order_by):
+        objects = bursty_queryset.order_by(order_by)
+        paginator = DatePaginator(objects, "date", None, skip_empty="day")
+
+        for page in paginator:
+            assert all(
+                page.min_date <= obj.date <= page.max_date for obj in page.object_list
+            )
+
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_null_dates(self, db, order_by):
+        for day in (1, 2, 20):
+            baker.make(NullableDateOrderableModel, date=datetime.date(2024, 1, day))
+        baker.make(NullableDateOrderableModel, date=None, _quantity=2)
+        objects = NullableDateOrderableModel.objects.order_by(order_by)
+
+        paginator = DatePaginator(objects, "date", None, skip_empty="week")
+
+        expected = [2, 1] if order_by == "date" else [1, 2]
+        assert [len(page.object_list) for page in paginator] == expected
+
+    def test_invalid_kind(self, model_data_queryset):
+        with pytest.raises(ValueError):
+            DatePaginator(model_data_queryset, "date", None, skip_empty="fortnight")
+
+    def test_with_target_per_page(self, model_data_queryset):
+        with pytest.raises(ValueError):
+            DatePaginator(
+                model_data_queryset,
+                "date",
+                None,
+                target_per_page=10,
+                skip_empty="day",
+            )
+
+
+class TestDatePaginatorPageSummaries:
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"page_date_range": datetime.timedelta(days=7)},
+            {"page_date_range": None, "target_per_page": 10},
+            {"page_date_range": None, "skip_empty": "week"},
+        ],
+    )
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_counts(self, objects, options, order_by):
+        if isinstance(objects, QuerySet):  # type: ignore[misc]
+            objects = objects.order_by(order_by)
+        elif order_by == "-date":
+            objects = list(reversed(objects))
+        paginator = DatePaginator(objects, "date", **options)
+
+        summaries = paginator.page_summaries()
+
+        assert [summary.number for summary in summaries] == list(paginator.page_range)
+        for summary, page in zip(summaries, paginator, strict=True):
+            assert summary.count == len(page.object_list)
+            assert (summary.start_date, summary.end_date) == (
+                page.start_date,
+                page.end_date,
+            )
+
+    def test_aggregates(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7)
+        )
+        paginator.date_segments  # noqa: B018
+
+        with django_assert_num_queries(1):
+            summaries = paginator.page_summaries(
+                total=Sum("id"), latest=Max("date"), rows=Count("id")
+            )
+
+        for summary, page in zip(summaries, paginator, strict=True):
+            assert summary.aggregates["total"] == sum(
+                obj.id for obj in page.object_list
+            )
+            assert summary.aggregates["latest"] == max(
+                obj.date for obj in page.object_list
+            )
+            assert summary.aggregates["rows"] == summary.count
+
+    def test_empty_pages(self, db):
+        baker.make(DateOrderableModel, date=datetime.date(2024, 1, 1))
+        baker.make(DateOrderableModel, date=datetime.date(2024, 1, 10))
+        paginator = DatePaginator(
+            DateOrderableModel.objects.order_by("date"),
+            "date",
+            datetime.timedelta(days=1),
+        )
+
+        summaries = paginator.page_summaries(rows=Count("id"), total=Sum("id"))
+
+        assert [summary.count for summary in summaries] == [1] + [0] * 8 + [1]
+        assert summaries[1].aggregates == {"rows": 0, "total": None}
+
+    @pytest.mark.parametrize("order_by", ["date", "-date"])
+    def test_many_pages(self, model_data_queryset, order_by):
+        objects = model_data_queryset.order_by(order_by)
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=1))
+
+        summaries = paginator.page_summaries(latest=Max("date"))
+
+        assert len(summaries) == 90
+        for summary, page in zip(summaries, paginator, strict=True):
+            assert summary.count == len(page.object_list) == 1
+            assert summary.aggregates["latest"] == page.object_list[0].date
+
+    def test_null_dates(self, db, django_assert_num_queries):
+        for day in (1, 2, 9):
+            baker.make(NullableDateOrderableModel, date=datetime.date(2024, 1, day))
+        baker.make(NullableDateOrderableModel, date=None, _quantity=2)
+        paginator = DatePaginator(
+            NullableDateOrderableModel.objects.order_by("date"),
+            "date",
+            datetime.timedelta(days=7),
+        )
+
+        paginator.date_segments  # noqa: B018
+
+        with django_assert_num_queries(1) as captured:
+            summaries = paginator.page_summaries(total=Sum("id"))
+
+        assert "IS NOT NULL" in captured.captured_queries[0]["sql"]
+        assert [summary.count for summary in summaries] == [2, 1]
+
+    def test_cached(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7)
+        )
+        summaries = paginator.page_summaries(total=Sum("id"))
+
+        with django_assert_num_queries(0):
+            assert paginator.page_summaries(total=Sum("id")) is summaries
+
+    def test_aggregates_on_list(self, model_data_queryset):
+        paginator = DatePaginator(
+            list(model_data_queryset), "date", datetime.timedelta(days=7)
+        )
+
+        with pytest.raises(ValueError):
+            paginator.page_summaries(total=Sum("id"))
+
+    def test_empty(self, db):
+        paginator = DatePaginator(
+            DateOrderableModel.objects.none().order_by("date"),
+            "date",
+            datetime.timedelta(days=7),
+        )
+
+        assert paginator.page_summaries(total=Sum("id")) == []
+
+
 class TestDatePaginatorInheritance:
     """
     Test that the DatePaginator respects the Django Paginator inheritance.
@@ -879,3 +1335,1051 @@ class TestDatePageInheritence:
         )
 
         assert last_page.end_index() == paginator.count
+
+
+class TestDatePaginatorNumberForDate:
+    @pytest.mark.parametrize(
+        "model_data_queryset",
+        [
+            ModelClassParams(model_class=DateOrderableModel, number_of_days=90),
+            ModelClassParams(model_class=DateTimeOrderableModel, number_of_days=90),
+        ],
+        indirect=["model_data_queryset"],
+    )
+    @pytest.mark.parametrize(
+        "page_date_range,kwargs",
+        [
+            (datetime.timedelta(days=7), {}),
+            (None, {"target_per_page": 10}),
+            (None, {"skip_empty": "week"}),
+        ],
+    )
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_matches_pages(self, model_data_queryset, page_date_range, kwargs, reverse):
+        objects = list(model_data_queryset)
+        if reverse:
+            objects.reverse()
+        paginator = DatePaginator(objects, "date", page_date_range, **kwargs)
+
+        for page in paginator:
+            for obj in page:
+                assert paginator.number_for_date(obj.date) == page.number
+                assert paginator.page_for_date(obj.date).number == page.number
+
+    def test_queryset_without_page_queries(self, objects, django_assert_num_queries):
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=7))
+        assert paginator.num_pages
+
+        with django_assert_num_queries(0):
+            assert paginator.number_for_date(paginator.page(1).start_date) == 1
+            assert (
+                paginator.number_for_date(paginator.date_segments[-1][0])
+                == paginator.num_pages
+            )
+
+    def test_out_of_range(self, objects):
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=7))
+        first_date = paginator.date_segments[0][0]
+        _, last_end_date = paginator.date_segments[-1]
+
+        with pytest.raises(EmptyPage):
+            paginator.number_for_date(first_date - datetime.timedelta(days=1))
+        with pytest.raises(EmptyPage):
+            paginator.number_for_date(last_end_date + datetime.timedelta(days=1))
+
+    def test_date_for_datetime_field(self, db):
+        now = datetime.datetime(2024, 1, 15, 12, tzinfo=datetime.timezone.utc)
+        baker.make(
+            DateTimeOrderableModel,
+            date=iter([now - datetime.timedelta(days=10), now]),
+            _quantity=2,
+        )
+        paginator = DatePaginator(
+            DateTimeOrderableModel.objects.order_by("date"),
+            "date",
+            datetime.timedelta(days=5),
+        )
+
+        assert paginator.number_for_date(datetime.date(2024, 1, 15)) == 2
+        assert paginator.number_for_date(datetime.date(2024, 1, 16)) == 3
+        assert paginator.number_for_date(now.replace(tzinfo=None)) == 3
+
+    def test_gap_with_skip_empty(self, db):
+        today = datetime.date(2024, 1, 15)
+        baker.make(
+            DateOrderableModel,
+            date=iter([today, today + datetime.timedelta(days=2)]),
+            _quantity=2,
+        )
+        paginator = DatePaginator(
+            DateOrderableModel.objects.order_by("date"), "date", None, skip_empty="day"
+        )
+
+        assert paginator.number_for_date(today + datetime.timedelta(days=2)) == 2
+        with pytest.raises(EmptyPage):
+            paginator.number_for_date(today + datetime.timedelta(days=1))
+
+    def test_empty(self):
+        paginator = DatePaginator([], "date", datetime.timedelta(days=7))
+
+        with pytest.raises(EmptyPage):
+            paginator.number_for_date(datetime.date(2024, 1, 1))
+
+
+class TestDatePaginatorElidedDateRange:
+    def test_matches_elided_page_range(self, objects, django_assert_num_queries):
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=3))
+        assert paginator.num_pages == 30
+
+        with django_assert_num_queries(0):
+            links = list(paginator.get_elided_date_range(15, on_each_side=2, on_ends=1))
+
+        assert [
+            link if link == Paginator.ELLIPSIS else link.number for link in links
+        ] == list(paginator.get_elided_page_range(15, on_each_side=2, on_ends=1))
+        for link in links:
+            if link != Paginator.ELLIPSIS:
+                number, start_date, end_date = link
+                assert (start_date, end_date) == paginator.date_segments[number - 1]
+
+    def test_adaptive(self, objects):
+        paginator = DatePaginator(objects, "date", None, target_per_page=10)
+
+        assert list(paginator.get_elided_date_range(1)) == [
+            DatePageLink(number, start_date, end_date)
+            for number, (start_date, end_date) in enumerate(
+                paginator.date_segments, start=1
+            )
+        ]
+
+
+class TestDatePaginatorChunkSize:
+    def test_streamed_page(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), chunk_size=2
+        )
+        expected = list(
+            DatePaginator(model_data_queryset, "date", datetime.timedelta(days=7)).page(
+                1
+            )
+        )
+        page = paginator.page(1)
+
+        with django_assert_num_queries(1) as captured:
+            assert len(page) == 7
+            assert len(page) == 7
+
+        assert "COUNT" in captured.captured_queries[0]["sql"]
+        assert list(page) == expected
+        assert list(page) == expected
+        assert page.object_list._result_cache is None
+
+    def test_template(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), chunk_size=2
+        )
+        page = paginator.page(1)
+        template = Template(
+            "{% for obj in page_obj %}{{ obj.pk }},{% endfor %}{{ page_obj|length }}"
+        )
+
+        expected = "".join(f"{obj.pk}," for obj in page) + "7"
+
+        rendered = template.render(Context({"page_obj": page}))
+
+        assert rendered == expected
+        assert page.object_list._result_cache is None
+
+    def test_async(self, model_data_queryset):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), chunk_size=2
+        )
+
+        async def objects():
+            return [obj async for obj in await paginator.apage(1)]
+
+        assert async_to_sync(objects)() == list(paginator.page(1).object_list)
+
+    def test_list(self, model_data_queryset):
+        objects = list(model_data_queryset)
+        paginator = DatePaginator(
+            objects, "date", datetime.timedelta(days=7), chunk_size=2
+        )
+
+        assert list(paginator.page(1)) == objects[:7]
+        assert len(paginator.page(1)) == 7
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            DatePaginator([], "date", datetime.timedelta(days=7), chunk_size=0)
+
+
+class TestDatePaginatorCache:
+    @pytest.fixture(autouse=True)
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        yield
+        caches["default"].clear()
+
+    @pytest.mark.parametrize(
+        "page_date_range,kwargs",
+        [
+            (datetime.timedelta(days=7), {}),
+            (None, {"target_per_page": 10}),
+            (None, {"skip_empty": "week"}),
+        ],
+    )
+    def test_reuses_cached_state(
+        self, model_data_queryset, page_date_range, kwargs, django_assert_num_queries
+    ):
+        paginator = DatePaginator(
+            model_data_queryset,
+            "date",
+            page_date_range,
+            cache_alias="default",
+            **kwargs,
+        )
+        expected = (list(paginator.date_segments), paginator.count)
+
+        with django_assert_num_queries(0):
+            paginator = DatePaginator(
+                model_data_queryset.all(),
+                "date",
+                page_date_range,
+                cache_alias="default",
+                **kwargs,
+            )
+            assert (list(paginator.date_segments), paginator.count) == expected
+            assert paginator.chronological
+
+    def test_keyed_by_query_and_options(self, model_data_queryset):
+        paginator = DatePaginator(
+            model_data_queryset,
+            "date",
+            datetime.timedelta(days=7),
+            cache_alias="default",
+        )
+        assert paginator.num_pages == 13
+
+        assert (
+            DatePaginator(
+                model_data_queryset,
+                "date",
+                datetime.timedelta(days=30),
+                cache_alias="default",
+            ).num_pages
+            == 3
+        )
+        assert (
+            DatePaginator(
+                model_data_queryset.filter(pk=model_data_queryset[0].pk),
+                "date",
+                datetime.timedelta(days=7),
+                cache_alias="default",
+            ).num_pages
+            == 1
+        )
+
+    def test_stale_without_version(self, model_data_queryset):
+        paginator = DatePaginator(
+            model_data_queryset,
+            "date",
+            datetime.timedelta(days=7),
+            cache_alias="default",
+        )
+        count = paginator.count
+
+        baker.make(DateOrderableModel, date=timezone.now())
+
+        paginator = DatePaginator(
+            model_data_queryset,
+            "date",
+            datetime.timedelta(days=7),
+            cache_alias="default",
+        )
+        assert paginator.count == count
+
+    def test_page_summaries_stale_without_version(self, model_data_queryset):
+        paginator = DatePaginator(
+            model_data_queryset,
+            "date",
+            datetime.timedelta(days=7),
+            cache_alias="default",
+        )
+        counts = [summary.count for summary in paginator.page_summaries()]
+
+        baker.make(
+            DateOrderableModel, date=timezone.now() + datetime.timedelta(days=30)
+        )
+
+        paginator = DatePaginator(
+            model_data_queryset,
+            "date",
+            datetime.timedelta(days=7),
+            cache_alias="default",
+        )
+        assert [summary.count for summary in paginator.page_summaries()] == counts
+
+    def test_invalidated_by_version(
+        self, model_data_queryset, django_assert_num_queries
+    ):
+        def make_paginator():
+            return DatePaginator(
+                model_data_queryset,
+                "date",
+                datetime.timedelta(days=7),
+                cache_alias="default",
+                cache_version=Max("pk"),
+            )
+
+        count = make_paginator().count
+
+        with django_assert_num_queries(1):
+            assert make_paginator().count == count
+
+        baker.make(DateOrderableModel, date=timezone.now())
+
+        with django_assert_num_queries(2):
+            assert make_paginator().count == count + 1
+
+    def test_list_not_cached(self, model_data_queryset):
+        objects = list(model_data_queryset)
+        paginator = DatePaginator(
+            objects, "date", datetime.timedelta(days=7), cache_alias="default"
+        )
+
+        assert paginator.num_pages == 13
+        assert paginator._cache_key is None
+
+    def test_version_requires_alias(self):
+        with pytest.raises(ValueError):
+            DatePaginator(
+                [], "date", datetime.timedelta(days=7), cache_version=Max("pk")
+            )
+
+
+class TestDatePaginatorAsync:
+    @pytest.mark.parametrize(
+        "page_date_range,kwargs",
+        [
+            (datetime.timedelta(days=7), {}),
+            (None, {"target_per_page": 10}),
+            (None, {"skip_empty": "week"}),
+        ],
+    )
+    def test_matches_sync(self, objects, page_date_range, kwargs):
+        paginator = DatePaginator(objects, "date", page_date_range, **kwargs)
+        apaginator = DatePaginator(objects, "date", page_date_range, **kwargs)
+
+        async def paginate():
+            return (
+                await apaginator.acount(),
+                await apaginator.anum_pages(),
+                list(await apaginator.adate_segments()),
+                await apaginator.achronological(),
+                [obj async for obj in await apaginator.apage(2)],
+            )
+
+        assert async_to_sync(paginate)() == (
+            paginator.count,
+            paginator.num_pages,
+            list(paginator.date_segments),
+            paginator.chronological,
+            list(paginator.page(2)),
+        )
+
+    def test_sync_api_after_await(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset.order_by("-date"), "date", datetime.timedelta(days=7)
+        )
+
+        page = async_to_sync(paginator.apage)(1)
+
+        with django_assert_num_queries(0):
+            assert paginator.count == 90
+            assert paginator.num_pages == 13
+            assert not paginator.chronological
+            assert paginator.page(2).start_date == page.end_date
+
+    def test_aget_page(self, model_data_queryset):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7)
+        )
+
+        assert async_to_sync(paginator.aget_page)("nope").number == 1
+        assert async_to_sync(paginator.aget_page)(None).number == 1
+        assert async_to_sync(paginator.aget_page)(100).number == 13
+        with pytest.raises(EmptyPage):
+            async_to_sync(paginator.apage)(100)
+
+    def test_cached(self, model_data_queryset, settings, django_assert_num_queries):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+
+        def make_paginator():
+            return DatePaginator(
+                model_data_queryset,
+                "date",
+                datetime.timedelta(days=7),
+                cache_alias="default",
+                cache_version=Max("pk"),
+            )
+
+        try:
+            num_pages = async_to_sync(make_paginator().anum_pages)()
+
+            # only the version is checked, once per paginator
+            with django_assert_num_queries(2):
+                assert async_to_sync(make_paginator().anum_pages)() == num_pages
+                assert make_paginator().num_pages == num_pages
+        finally:
+            caches["default"].clear()
+
+
+class TestDatePaginatorRowShapes:
+    def expected_pages(self, model_data_queryset):
+        paginator = DatePaginator(
+            list(model_data_queryset), "date", datetime.timedelta(days=7)
+        )
+        return [[obj.pk for obj in page] for page in paginator]
+
+    @pytest.mark.parametrize(
+        "model_data_queryset",
+        [
+            ModelClassParams(model_class=DateOrderableModel, number_of_days=90),
+            ModelClassParams(model_class=DateTimeOrderableModel, number_of_days=90),
+        ],
+        indirect=["model_data_queryset"],
+    )
+    @pytest.mark.parametrize("evaluate", [False, True])
+    def test_values(self, model_data_queryset, evaluate):
+        objects = model_data_queryset.values("pk", "date")
+        if evaluate:
+            objects = list(objects)
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=7))
+
+        assert [
+            [row["pk"] for row in page] for page in paginator
+        ] == self.expected_pages(model_data_queryset)
+
+    @pytest.mark.parametrize("evaluate", [False, True])
+    def test_values_list(self, model_data_queryset, evaluate):
+        objects = model_data_queryset.values_list("pk", "date")
+        if evaluate:
+            objects = list(objects)
+        paginator = DatePaginator(
+            objects, "date", datetime.timedelta(days=7), date_getter=itemgetter(1)
+        )
+
+        assert [[pk for pk, _ in page] for page in paginator] == self.expected_pages(
+            model_data_queryset
+        )
+
+    def test_named_values_list(self, model_data_queryset):
+        objects = list(model_data_queryset.values_list("pk", "date", named=True))
+        paginator = DatePaginator(objects, "date", datetime.timedelta(days=7))
+
+        assert [[row.pk for row in page] for page in paginator] == self.expected_pages(
+            model_data_queryset
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"target_per_page": 10}, {"skip_empty": "week"}]
+    )
+    def test_dicts_in_adaptive_modes(self, model_data_queryset, kwargs):
+        objects = list(model_data_queryset)
+        rows = [{"pk": obj.pk, "date": obj.date} for obj in objects]
+
+        expected = DatePaginator(objects, "date", None, **kwargs)
+        paginator = DatePaginator(rows, "date", None, **kwargs)
+
+        assert list(paginator.date_segments) == list(expected.date_segments)
+        assert [row["pk"] for row in paginator.page(2)] == [
+            obj.pk for obj in expected.page(2)
+        ]
+
+    def test_unordered_dicts(self):
+        rows = [{"date": datetime.date(2024, 1, day)} for day in (1, 3, 2)]
+
+        with pytest.raises(ValueError):
+            DatePaginator(rows, "date", datetime.timedelta(days=1))
+
+
+class TestDatePaginatorPrefetch:
+    @pytest.mark.parametrize(
+        "model_data_queryset",
+        [
+            ModelClassParams(model_class=DateOrderableModel, number_of_days=90),
+            ModelClassParams(model_class=DateTimeOrderableModel, number_of_days=90),
+        ],
+        indirect=["model_data_queryset"],
+    )
+    @pytest.mark.parametrize(
+        "page_date_range,kwargs",
+        [
+            (datetime.timedelta(days=7), {}),
+            (None, {"target_per_page": 10}),
+            (None, {"skip_empty": "week"}),
+        ],
+    )
+    @pytest.mark.parametrize("ordering", ["date", "-date"])
+    def test_matches_pages(
+        self, model_data_queryset, page_date_range, kwargs, ordering
+    ):
+        objects = model_data_queryset.order_by(ordering)
+        expected = DatePaginator(objects, "date", page_date_range, **kwargs)
+        paginator = DatePaginator(
+            objects, "date", page_date_range, prefetch_pages=3, **kwargs
+        )
+
+        assert [list(page) for page in paginator] == [list(page) for page in expected]
+
+    def test_one_query_per_prefetch(
+        self, model_data_queryset, django_assert_num_queries
+    ):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), prefetch_pages=2
+        )
+        assert paginator.num_pages == 13
+
+        with django_assert_num_queries(1):
+            list(paginator.page(1))
+            list(paginator.page(2))
+            list(paginator.page(3))
+
+        with django_assert_num_queries(1):
+            list(paginator.page(4))
+
+    def test_last_pages(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), prefetch_pages=5
+        )
+        assert paginator.num_pages == 13
+
+        with django_assert_num_queries(1):
+            assert [len(paginator.page(number)) for number in (11, 12, 13)] == [7, 7, 6]
+
+    def test_lru(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), prefetch_pages=4
+        )
+        paginator.prefetch_cache_size = 2
+        assert paginator.num_pages == 13
+
+        list(paginator.page(1))
+
+        assert list(paginator._prefetched_pages) == [4, 5]
+        with django_assert_num_queries(1):
+            list(paginator.page(2))
+
+    def test_async(self, model_data_queryset, django_assert_num_queries):
+        paginator = DatePaginator(
+            model_data_queryset, "date", datetime.timedelta(days=7), prefetch_pages=1
+        )
+
+        async def pages():
+            first = [obj async for obj in await paginator.apage(1)]
+            second = [obj async for obj in await paginator.apage(2)]
+            return first, second
+
+        first, second = async_to_sync(pages)()
+
+        assert first == list(
+            DatePaginator(model_data_queryset, "date", datetime.timedelta(days=7)).page(
+                1
+            )
+        )
+        assert len(second) == 7
+
+    def test_negative(self):
+        with pytest.raises(ValueError):
+            DatePaginator([], "date", datetime.timedelta(days=7), prefetch_pages=-1)
+
+    @pytest.mark.parametrize("flat", [False, True])
+    def test_values_list_requires_date_getter(self, model_data_queryset, flat):
+        objects = (
+            model_data_queryset.values_list("date", flat=True)
+            if flat
+            else model_data_queryset.values_list("pk", "date")
+        )
+
+        with pytest.raises(ValueError):
+            DatePaginator(objects, "date", datetime.timedelta(days=7), prefetch_pages=1)
+
+    def test_values_list_with_date_getter(self, model_data_queryset):
+        objects = model_data_queryset.values_list("pk", "date")
+        paginator = DatePaginator(
+            objects,
+            "date",
+            datetime.timedelta(days=7),
+            date_getter=itemgetter(1),
+            prefetch_pages=1,
+        )
+
+        assert list(paginator.page(1)) == list(
+            DatePaginator(objects, "date", datetime.timedelta(days=7)).page(1)
+        )
+        assert len(paginator.page(2)) == 7
+
+    def test_values(self, model_data_queryset):
+        objects = model_data_queryset.values("pk", "date")
+        paginator = DatePaginator(
+            objects, "date", datetime.timedelta(days=7), prefetch_pages=1
+        )
+
+        assert len(paginator.page(1)) == 7
+        assert len(paginator.page(2)) == 7
+
+
+class TestGroupedDatePaginator:
+    @pytest.fixture
+    def objects(self, db):
+        start = datetime.date(2024, 1, 1)
+        for group, days in ((1, range(30)), (2, range(10, 100, 3)), (None, [5, 6, 8])):
+            for day in days:
+                baker.make(
+                    GroupedDateOrderableModel,
+                    group=group,
+                    date=start + datetime.timedelta(days=day),
+                )
+        return GroupedDateOrderableModel.objects.order_by("-date")
+
+    def test_matches_date_paginators(self, objects, django_assert_num_queries):
+        page_date_range = datetime.timedelta(days=7)
+
+        with django_assert_num_queries(1):
+            grouped = GroupedDatePaginator(objects, "date", page_date_range, "group")
+            assert set(grouped.groups) == {None, 1, 2}
+            assert grouped.page_counts == {None: 1, 1: 5, 2: 13}
+
+        for group, paginator in grouped.items():
+            expected = DatePaginator(
+                objects.filter(group=group), "date", page_date_range
+            )
+            assert paginator.count == expected.count
+            assert not paginator.chronological
+            assert list(paginator.date_segments) == list(expected.date_segments)
+            assert list(paginator.page(1)) == list(expected.page(1))
+
+    def test_same_paginator(self, objects):
+        grouped = GroupedDatePaginator(
+            objects, "date", datetime.timedelta(days=7), "group"
+        )
+
+        assert grouped[1] is grouped[1]
+        assert len(grouped) == 3
+        assert 3 not in grouped
+        with pytest.raises(KeyError):
+            grouped[3]
+
+    def test_ambiguous_ordering(self, objects, django_assert_num_queries):
+        objects = objects.order_by("date", "-date")
+        grouped = GroupedDatePaginator(
+            objects, "date", datetime.timedelta(days=7), "group"
+        )
+
+        with django_assert_num_queries(1):
+            assert [paginator.chronological for paginator in grouped.values()] == [
+                True,
+                True,
+                True,
+            ]
+
+    def test_requires_queryset(self, objects):
+        with pytest.raises(TypeError):
+            GroupedDatePaginator(
+                list(objects), "date", datetime.timedelta(days=7), "group"
+            )
+
+    def test_requires_ordering(self, objects):
+        with pytest.raises(ValueError):
+            GroupedDatePaginator(
+                objects.order_by("group"), "date", datetime.timedelta(days=7), "group"
+            )
+
+
+class TestStreamingDatePaginator:
+    @pytest.mark.parametrize(
+        "model_data_queryset",
+        [
+            ModelClassParams(model_class=DateOrderableModel, number_of_days=90),
+            ModelClassParams(model_class=DateTimeOrderableModel, number_of_days=90),
+        ],
+        indirect=["model_data_queryset"],
+    )
+    @pytest.mark.parametrize("days_per_page", [1, 7, 30, 365])
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_matches_date_paginator(self, model_data_queryset, days_per_page, reverse):
+        objects = list(model_data_queryset)
+        if reverse:
+            objects.reverse()
+        page_date_range = datetime.timedelta(days=days_per_page)
+        expected = list(DatePaginator(objects, "date", page_date_range))
+
+        pages = list(StreamingDatePaginator(iter(objects), "date", page_date_range))
+
+        assert [
+            (page.number, page.start_date, page.end_date, list(page)) for page in pages
+        ] == [
+            (page.number, page.start_date, page.end_date, list(page))
+            for page in expected
+        ]
+        assert [page.has_next() for page in pages] == [
+            page.has_next() for page in expected
+        ]
+
+    def test_queryset_iterator(self, model_data_queryset, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            pages = list(
+                StreamingDatePaginator(
+                    model_data_queryset, "date", datetime.timedelta(days=7)
+                )
+            )
+
+        assert len(pages) == 13
+        assert sum(len(page) for page in pages) == 90
+
+    def test_lazy(self):
+        def rows():
+            for day in range(1, 32):
+                yield {"date": datetime.date(2024, 1, day)}
+            pytest.fail("read past the pages that were asked for")
+
+        pages = iter(StreamingDatePaginator(rows(), "date", datetime.timedelta(days=7)))
+        first = next(pages)
+
+        assert first.start_date == datetime.date(2024, 1, 1)
+        assert [row["date"].day for row in first] == [1, 2, 3, 4, 5, 6, 7]
+        assert first.has_next()
+        assert first.next_page_number() == 2
+        assert (first.start_index(), first.end_index()) == (1, 7)
+        assert repr(first) == "<Page 1>"
+
+        second = next(pages)
+
+        assert (second.start_index(), second.end_index()) == (8, 14)
+        assert second.previous_page_number() == 1
+
+    def test_empty_pages(self):
+        rows = [
+            (datetime.date(2024, 1, 1),),
+            (datetime.date(2024, 1, 20),),
+        ]
+
+        pages = list(
+            StreamingDatePaginator(
+                rows, "date", datetime.timedelta(days=7), date_getter=itemgetter(0)
+            )
+        )
+
+        assert [len(page) for page in pages] == [1, 0, 1]
+        assert (pages[1].start_index(), pages[1].end_index()) == (0, 1)
+        assert not pages[-1].has_next()
+        with pytest.raises(EmptyPage):
+            pages[-1].next_page_number()
+
+    def test_empty(self):
+        assert (
+            list(StreamingDatePaginator([], "date", datetime.timedelta(days=7))) == []
+        )
+
+    def test_unordered(self):
+        rows = [{"date": datetime.date(2024, 1, day)} for day in (1, 10, 2)]
+        pages = iter(StreamingDatePaginator(rows, "date", datetime.timedelta(days=30)))
+
+        with pytest.raises(ValueError):
+            next(pages)
+
+
+class TestCountlessPaginator:
+    @pytest.fixture(params=["queryset", "list"])
+    def objects(self, request, db):
+        baker.make(DateOrderableModel, _quantity=25)
+        objects = DateOrderableModel.objects.order_by("pk")
+        return objects if request.param == "queryset" else list(objects)
+
+    def test_pages(self, objects):
+        paginator = CountlessPaginator(objects, 10)
+
+        first, second, third = paginator.page(1), paginator.page(2), paginator.page(3)
+
+        assert [len(page) for page in (first, second, third)] == [10, 10, 5]
+        assert [obj for page in (first, second, third) for obj in page] == list(objects)
+        assert first.has_next()
+        assert not first.has_previous()
+        assert second.has_next()
+        assert second.has_previous()
+        assert not third.has_next()
+        assert third.has_previous()
+        assert first.next_page_number() == 2
+        assert (third.start_index(), third.end_index()) == (21, 25)
+
+    def test_no_count(self, db, django_assert_num_queries):
+        baker.make(DateOrderableModel, _quantity=25)
+        paginator = CountlessPaginator(DateOrderableModel.objects.order_by("pk"), 10)
+
+        with django_assert_num_queries(1) as captured:
+            page = paginator.page(2)
+            assert page.has_next()
+            assert page.has_other_pages()
+
+        assert "COUNT" not in captured.captured_queries[0]["sql"]
+
+    def test_exact_multiple(self, objects):
+        paginator = CountlessPaginator(objects, 5)
+
+        assert paginator.page(4).has_next()
+        assert not paginator.page(5).has_next()
+        with pytest.raises(EmptyPage):
+            paginator.page(6)
+
+    def test_num_pages_known_so_far(self, objects):
+        paginator = CountlessPaginator(objects, 10)
+
+        assert paginator.num_pages == 0
+        paginator.page(1)
+        assert paginator.num_pages == 2
+        assert list(paginator.get_elided_page_range(1)) == [1, 2]
+        paginator.page(3)
+        assert paginator.num_pages == 3
+
+    def test_validate_number(self, objects):
+        paginator = CountlessPaginator(objects, 10)
+
+        assert paginator.validate_number(1000) == 1000
+        with pytest.raises(PageNotAnInteger):
+            paginator.validate_number("one")
+        with pytest.raises(EmptyPage):
+            paginator.validate_number(0)
+
+    def test_empty(self, db):
+        paginator = CountlessPaginator(DateOrderableModel.objects.none(), 10)
+
+        page = paginator.page(1)
+
+        assert len(page) == 0
+        assert not page.has_other_pages()
+        assert page.start_index() == 0
+
+    def test_empty_not_allowed(self, db):
+        paginator = CountlessPaginator(
+            DateOrderableModel.objects.none(), 10, allow_empty_first_page=False
+        )
+
+        with pytest.raises(EmptyPage):
+            paginator.page(1)
+
+    def test_orphans(self, objects):
+        with pytest.warns(UserWarning):
+            CountlessPaginator(objects, 10, orphans=5)
+
+
+class TestCountStrategyPaginator:
+    @pytest.fixture
+    def locmem_cache(self, settings):
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        yield
+        caches["default"].clear()
+
+    def test_exact_count_by_default(self, db):
+        baker.make(DateOrderableModel, _quantity=25)
+        paginator = CountStrategyPaginator(
+            DateOrderableModel.objects.order_by("pk"), 10
+        )
+
+        assert isinstance(paginator.count_strategy, ExactCount)
+        assert paginator.count == 25
+        assert paginator.num_pages == 3
+        with pytest.raises(EmptyPage):
+            paginator.page(4)
+
+    def test_cached_count(self, db, locmem_cache, django_assert_num_queries):
+        baker.make(DateOrderableModel, _quantity=25)
+        objects = DateOrderableModel.objects.order_by("pk")
+
+        with django_assert_num_queries(1):
+            assert (
+                CountStrategyPaginator(objects, 10, count_strategy=CachedCount()).count
+                == 25
+            )
+
+        baker.make(DateOrderableModel)
+
+        with django_assert_num_queries(0):
+            paginator = CountStrategyPaginator(
+                objects.all(), 10, count_strategy=CachedCount()
+            )
+            assert paginator.count == 25
+            assert list(paginator.get_elided_page_range(1)) == [1, 2, 3]
+
+    def test_cached_count_keyed_by_query(self, db, locmem_cache):
+        baker.make(DateOrderableModel, _quantity=25)
+        objects = DateOrderableModel.objects.order_by("pk")
+        strategy = CachedCount()
+
+        assert strategy.count(objects) == 25
+        assert strategy.count(objects.filter(pk__lte=objects[4].pk)) == 5
+        assert strategy.count(objects.none()) == 0
+
+    def test_approximate_count_serves_later_pages(self, db, locmem_cache):
+        baker.make(DateOrderableModel, _quantity=25)
+        objects = DateOrderableModel.objects.order_by("pk")
+        assert CachedCount().count(objects) == 25
+
+        baker.make(DateOrderableModel, _quantity=10)
+        paginator = CountStrategyPaginator(objects, 10, count_strategy=CachedCount())
+        page = paginator.page(4)
+
+        assert paginator.count == 25
+        assert len(page) == 5
+        assert paginator.num_pages == 4
+        assert list(paginator.get_elided_page_range(4)) == [1, 2, 3, 4]
+        with pytest.raises(EmptyPage):
+            paginator.page(0)
+
+    def test_estimated_count_falls_back_to_exact(self, db):
+        baker.make(DateOrderableModel, _quantity=25)
+        objects = DateOrderableModel.objects.order_by("pk")
+
+        assert EstimatedCount().estimate(objects) is None
+        assert EstimatedCount(threshold=0).count(objects) == 25
+        assert EstimatedCount().count(list(objects)) == 25
+
+    @pytest.mark.parametrize(
+        "explain",
+        [
+            # Django >= 4.2 joins the elements of the plan array
+            '{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 5000}}',
+            '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 5000}}]',
+        ],
+    )
+    def test_estimated_count_postgresql(self, db, monkeypatch, explain):
+        baker.make(DateOrderableModel, _quantity=25)
+        objects = DateOrderableModel.objects.order_by("pk")
+        monkeypatch.setattr(connections[objects.db], "vendor", "postgresql")
+        monkeypatch.setattr(QuerySet, "explain", lambda self, **options: explain)
+
+        assert EstimatedCount().estimate(objects) == 5000
+        assert EstimatedCount().count(objects) == 5000
+        assert EstimatedCount(threshold=10_000).count(objects) == 25
+
+
+class TestKeysetPaginator:
+    @pytest.fixture
+    def queryset(self, db):
+        # three rows per day so the `pk` tie breaker is needed
+        start = datetime.date(2024, 1, 1)
+        dates = [start + datetime.timedelta(days=i // 3) for i in range(25)]
+        baker.make(DateOrderableModel, date=iter(dates), _quantity=len(dates))
+        return DateOrderableModel.objects.all()
+
+    def walk(self, paginator):
+        pages = [paginator.page()]
+        while pages[-1].has_next():
+            pages.append(paginator.page(pages[-1].next_cursor))
+        return pages
+
+    @pytest.mark.parametrize(
+        "ordering",
+        [("date",), ("-date",), ("date", "-id"), ("-date", "id"), ("id",), ()],
+    )
+    def test_walk_forward(self, queryset, ordering):
+        objects = queryset.order_by(*ordering)
+        paginator = KeysetPaginator(objects, 4)
+
+        pages = self.walk(paginator)
+
+        # ties are broken on the primary key, in the direction of the last column
+        expected = queryset.order_by(
+            *(
+                f"{'' if ascending else '-'}{name}"
+                for name, ascending in paginator.ordering
+            )
+        )
+        assert [obj for page in pages for obj in page] == list(expected)
+        assert [len(page) for page in pages] == [4] * 6 + [1]
+        assert not pages[0].has_previous()
+        assert pages[0].previous_cursor is None
+        assert all(page.has_previous() for page in pages[1:])
+        assert pages[-1].next_cursor is None
+
+    @pytest.mark.parametrize("ordering", [("date",), ("-date",), ("date", "-id")])
+    def test_walk_backward(self, queryset, ordering):
+        objects = queryset.order_by(*ordering)
+        paginator = KeysetPaginator(objects, 4)
+        forward = self.walk(paginator)
+
+        page = forward[-1]
+        backward = [page]
+        while page.has_previous():
+            page = paginator.page(page.previous_cursor)
+            backward.append(page)
+
+        assert [list(page) for page in reversed(backward)] == [
+            list(page) for page in forward
+        ]
+        assert all(page.has_next() for page in backward[1:])
+
+    def test_reverse(self, queryset):
+        objects = queryset.order_by("date").reverse()
+        paginator = KeysetPaginator(objects, 4)
+
+        pages = self.walk(paginator)
+
+        assert paginator.ordering == [("date", False), ("pk", False)]
+        assert [obj for page in pages for obj in page] == list(
+            queryset.order_by("-date", "-pk")
+        )
+
+    def test_datetime(self, db):
+        now = timezone.now().replace(microsecond=123456)
+        dates = [now - datetime.timedelta(microseconds=i) for i in range(5)]
+        baker.make(DateTimeOrderableModel, date=iter(dates), _quantity=len(dates))
+        objects = DateTimeOrderableModel.objects.order_by("-date")
+        paginator = KeysetPaginator(objects, 2)
+
+        pages = self.walk(paginator)
+
+        assert [obj for page in pages for obj in page] == list(objects)
+
+    def test_one_query_per_page(self, queryset, django_assert_num_queries):
+        paginator = KeysetPaginator(queryset.order_by("date"), 4)
+        page = paginator.page()
+
+        with django_assert_num_queries(1) as captured:
+            page = paginator.page(page.next_cursor)
+
+        sql = captured.captured_queries[0]["sql"]
+        assert "COUNT" not in sql
+        assert "OFFSET" not in sql
+        assert len(page) == 4
+
+    @pytest.mark.parametrize(
+        "cursor", ["not-a-cursor", "e30", "eyJwIjpmYWxzZSwiayI6WzFdfQ"]
+    )
+    def test_invalid_cursor(self, queryset, cursor):
+        paginator = KeysetPaginator(queryset.order_by("date"), 4)
+
+        with pytest.raises(InvalidCursor):
+            paginator.page(cursor)
+
+    def test_empty(self, db):
+        paginator = KeysetPaginator(DateOrderableModel.objects.order_by("date"), 4)
+        page = paginator.page()
+
+        assert len(page) == 0
+        assert not page.has_other_pages()
+        assert page.next_cursor is None
+
+    def test_list(self, queryset):
+        with pytest.raises(TypeError):
+            KeysetPaginator(list(queryset), 4)
+
+    def test_random_ordering(self, queryset):
+        with pytest.raises(ValueError):
+            KeysetPaginator(queryset.order_by("?"), 4)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import datetime
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
@@ -10,6 +12,7 @@ from django.template import RequestContext
 from django.template import Template
 from model_bakery import baker
 
+from django_twc_toolbox.paginator import DatePaginator
 from django_twc_toolbox.templatetags.django_twc_toolbox import class_name
 from django_twc_toolbox.templatetags.django_twc_toolbox import display_name
 from django_twc_toolbox.templatetags.django_twc_toolbox import elided_page_range
@@ -166,6 +169,30 @@ def test_elided_page_range_templatetag(object_count, per_page, page, expected):
     assert expected in rendered
 
 
+def test_elided_date_page_range_templatetag():
+    objects = [
+        {"date": datetime.date(2024, 1, 1) + datetime.timedelta(days=day)}
+        for day in range(100)
+    ]
+    paginator = DatePaginator(objects, "date", datetime.timedelta(days=10))
+    page_obj = paginator.page(5)
+
+    template = Template(
+        "{% load django_twc_toolbox %}"
+        "{% elided_date_page_range page_obj on_each_side=1 on_ends=1 as range %}"
+        "{% for link in range %}"
+        "{% if link == page_obj.paginator.ELLIPSIS %}{{ link }} "
+        "{% else %}{{ link.number }}:{{ link.start_date|date:'m/d' }} {% endif %}"
+        "{% endfor %}"
+    )
+
+    rendered = template.render(Context({"page_obj": page_obj}))
+
+    assert rendered == (
+        f"1:01/01 {Paginator.ELLIPSIS} 4:01/31 5:02/10 6:02/20 {Paginator.ELLIPSIS} 10:03/31 "
+    )
+
+
 @pytest.mark.parametrize(
     "url,params,expected",
     [